@@ -1,15 +1,25 @@
 import os
 import re
 import json
+import queue
+import atexit
 import logging
+import logging.handlers
 import asyncio
 import random
+import shutil
+import threading
+import functools
+import contextlib
 import subprocess
+import unicodedata
 import aiohttp
 from pathlib import Path
+from collections import deque
 from urllib.parse import quote, urlparse, parse_qs
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional
+from time import monotonic
+from typing import Dict, List, Optional, Set
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
@@ -24,6 +34,7 @@ from telegram.ext import (
     JobQueue,
 )
 from telegram.constants import ParseMode
+from telegram.error import RetryAfter
 
 # --- SPOTDL FALLBACK ---
 try:
@@ -41,40 +52,57 @@ except ImportError:
 
 # --- TUBETIFY CONVERTER ---
 try:
-    from tubetify_converter import spotify_to_youtube, get_youtube_for_spotify
+    from tubetify_converter import spotify_to_youtube, get_youtube_for_spotify, close_tubetify_converter
     TUBETIFY_AVAILABLE = True
 except ImportError:
     TUBETIFY_AVAILABLE = False
 
 # --- CUSTOM CONVERTER ---
 try:
-    from custom_converter import spotify_to_youtube_custom, get_youtube_for_spotify_custom
+    from custom_converter import spotify_to_youtube_custom, get_youtube_for_spotify_custom, close_custom_converter
     CUSTOM_CONVERTER_AVAILABLE = True
 except ImportError:
     CUSTOM_CONVERTER_AVAILABLE = False
 
+# --- AUDIO METADATA ---
+try:
+    from mutagen import File as MutagenFile, MutagenError
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+# --- FAST JSON ---
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # --- CONFIGURATION ---
 TELEGRAM_TOKEN = 'YOUR_TELEGRAM_BOT_TOKEN_HERE' # Replace with your actual bot token
 DB_FILE = Path('playlist_db.json')
 MUSIC_DIR = Path('/music/local')
 LOGS_DIR = Path('logs')
 SETTINGS_FILE = Path('bot_settings.json')
+DB_BACKUP_INTERVAL_SECONDS = 3600  # Refresh playlist_db.json.backup at most this often
+SETTINGS_RECHECK_SECONDS = 2.0  # Trust the cached settings this long before re-stat()ing the file
 
 # --- DOWNLOAD METHODS CONFIGURATION ---
+# Availability comes from the import checks above, so it is fixed for the process lifetime
 DOWNLOAD_METHODS = {
     'spotify_youtube_ytdlp': {
         'name': '🎯 Spotify→YouTube→yt-dlp',
-        'available': lambda: (TUBETIFY_AVAILABLE or CUSTOM_CONVERTER_AVAILABLE) and YTDLP_AVAILABLE,
+        'available': (TUBETIFY_AVAILABLE or CUSTOM_CONVERTER_AVAILABLE) and YTDLP_AVAILABLE,
         'description': 'Convert Spotify to YouTube, then download via yt-dlp'
     },
     'spotdl': {
         'name': '🎵 SpotDL',
-        'available': lambda: SPOTDL_AVAILABLE,
+        'available': SPOTDL_AVAILABLE,
         'description': 'Direct YouTube download via SpotDL'
     },
     'spotdown': {
         'name': '🌐 SpotDown',
-        'available': lambda: True,  # Always available
+        'available': True,  # Always available
         'description': 'Original SpotDown.app API method'
     }
 }
@@ -82,9 +110,21 @@ DOWNLOAD_METHODS = {
 # --- RETRY CONFIGURATION ---
 MAX_API_ATTEMPTS = 3       # Maximum attempts for API calls (reduced to prevent infinite loops)
 MAX_DOWNLOAD_ATTEMPTS = 2  # Try to download each song up to 2 times (reduced to prevent infinite loops)
-RETRY_DELAY_SECONDS = 3    # Wait 3 seconds between attempts
+RETRY_DELAY_SECONDS = 3    # Base delay for exponential backoff between attempts
+RETRY_MAX_DELAY_SECONDS = 60  # Upper bound for a single backoff sleep
 API_TIMEOUT = 30000        # API request timeout in milliseconds
 
+# --- CONCURRENCY CONFIGURATION ---
+MAX_SYNC_CONCURRENCY = 5   # Playlists fetched in parallel during a sync
+MAX_DOWNLOAD_CONCURRENCY = 4  # Songs downloaded in parallel per batch
+PROGRESS_UPDATE_SECONDS = 2.0  # Minimum gap between Telegram progress message edits
+STREAM_WRITE_BUFFER = 1024 * 1024  # Bytes gathered from the network before each off-loop disk write
+MAX_INTEGRITY_CONCURRENCY = 4  # Playlists checked in parallel by "Check All Playlists"
+PROXY_ALIVE_TTL_SECONDS = 60  # Reuse a verified proxy without re-testing for this long
+PROXY_TEST_CONCURRENCY = 20  # Proxies probed at once when looking for a working one
+INTEGRITY_CACHE_TTL_SECONDS = 24 * 3600  # Trust a clean integrity check of an unchanged folder this long
+SPOTIFY_TOKEN_TTL_SECONDS = 50 * 60  # Reuse captured web-player tokens this long (they last about an hour)
+
 # --- LOGGING CONFIGURATION ---
 LOGS_DIR.mkdir(exist_ok=True)
 
@@ -100,10 +140,32 @@ console_handler.setLevel(logging.INFO)
 console_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(console_formatter)
 
-# Configure root logger
+# Component log files; the filters keep the routing that per-logger handlers gave
+sync_handler = logging.FileHandler(LOGS_DIR / 'sync.log', encoding='utf-8')
+sync_handler.setFormatter(file_formatter)
+sync_handler.addFilter(logging.Filter('sync'))
+
+download_handler = logging.FileHandler(LOGS_DIR / 'download.log', encoding='utf-8')
+download_handler.setFormatter(file_formatter)
+download_handler.addFilter(logging.Filter('download'))
+
+# Log calls only enqueue the record; one background thread does the actual writes
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, console_handler, sync_handler, download_handler,
+    respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Real formatting happens in the listener's handlers
+
+# Configure root logger (force: the helper modules imported above already called basicConfig)
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[file_handler, console_handler]
+    handlers=[queue_handler],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
@@ -133,18 +195,26 @@ else:
 
 # Additional loggers for different components
 sync_logger = logging.getLogger('sync')
-sync_handler = logging.FileHandler(LOGS_DIR / 'sync.log', encoding='utf-8')
-sync_handler.setFormatter(file_formatter)
-sync_logger.addHandler(sync_handler)
 sync_logger.setLevel(logging.INFO)
 
 download_logger = logging.getLogger('download')
-download_handler = logging.FileHandler(LOGS_DIR / 'download.log', encoding='utf-8')
-download_handler.setFormatter(file_formatter)
-download_logger.addHandler(download_handler)
 download_logger.setLevel(logging.INFO)
 
 # --- HELPER FUNCTIONS ---
+def retry_delay(attempt: int) -> float:
+    """Backoff before retry number `attempt + 1`, using full jitter
+
+    Spreads retries uniformly over [0, base * 2^attempt] so concurrent downloads
+    that failed together don't hit the server again in lockstep.
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_DELAY_SECONDS * (2 ** attempt)))
+
+# Characters that trip up Telegram's markdown parser, swapped for plain ASCII look-alikes
+# (most accented characters work fine and are kept)
+_MD_UNSAFE_CHARS = (
+    ('ø', 'o'), ('Ø', 'O'), ('ł', 'l'), ('Ł', 'L'), ('đ', 'd'), ('Đ', 'D'), ('ß', 'ss'),
+)
+
 def escape_markdown(text) -> str:
     """Escape markdown special characters for Telegram"""
     if text is None:
@@ -152,33 +222,23 @@ def escape_markdown(text) -> str:
 
     text_str = str(text)
 
-    # First handle any problematic Unicode characters by normalizing them
-    try:
-        import unicodedata
-        # Normalize unicode characters and ensure proper UTF-8 encoding
-        text_str = unicodedata.normalize('NFKC', text_str)
-        text_str = text_str.encode('utf-8', errors='replace').decode('utf-8')
-
-        # Replace potentially problematic characters that cause Telegram parsing issues
-        replacements = {
-            'ø': 'o',
-            'Ø': 'O',
-            'ł': 'l',
-            'Ł': 'L',
-            'đ': 'd',
-            'Đ': 'D',
-            'ß': 'ss',
-            # Keep most accented characters as they usually work fine
-        }
+    # Handle problematic Unicode characters by normalizing them. Pure ASCII text is
+    # unchanged by all of this, and most titles are ASCII, so skip it for those
+    if not text_str.isascii():
+        try:
+            # Normalize unicode characters and ensure proper UTF-8 encoding
+            text_str = unicodedata.normalize('NFKC', text_str)
+            text_str = text_str.encode('utf-8', errors='replace').decode('utf-8')
 
-        for old, new in replacements.items():
-            text_str = text_str.replace(old, new)
+            for old, new in _MD_UNSAFE_CHARS:
+                text_str = text_str.replace(old, new)
 
-    except (UnicodeEncodeError, UnicodeDecodeError, ImportError):
-        # If there are encoding issues, replace problematic characters
-        text_str = str(text).encode('ascii', errors='replace').decode('ascii')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            # If there are encoding issues, replace problematic characters
+            text_str = str(text).encode('ascii', errors='replace').decode('ascii')
 
-    # Then escape markdown special characters that are used by Telegram markdown
+    # Then escape markdown special characters that are used by Telegram markdown.
+    # Chained str.replace beats a str.translate table on short strings like titles.
     # Order matters - do backslash first to avoid double escaping
     text_str = text_str.replace('\\', '\\\\')
     text_str = text_str.replace('*', '\\*')
@@ -227,44 +287,161 @@ def normalize_track_info(track_info: dict) -> dict:
         'previewUrl': preview_url
     }
 
+def _json_dumps(data, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(raw):
+    """Parse JSON bytes or str, using orjson when available (its errors subclass json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def write_bytes(path: Path, data: bytes) -> int:
+    """Write a whole payload atomically and return its size on disk
+
+    Goes through a '.part' file plus os.replace so scans never see a half-written
+    song. Blocking (mkdir, write, stat), so call it via asyncio.to_thread.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = path.with_name(path.name + '.part')
+    try:
+        with open(part_path, 'wb', buffering=1024 * 1024) as f:
+            f.write(data)
+        os.replace(part_path, path)
+    finally:
+        if part_path.exists():
+            part_path.unlink()
+    return path.stat().st_size
+
+async def stream_to_file(response, part_path: Path):
+    """Stream an aiohttp response body into `part_path` without blocking the event loop
+
+    Network chunks are gathered into STREAM_WRITE_BUFFER-sized writes, so each
+    thread hop moves a megabyte instead of 64 KiB; opening and closing the file
+    happen off the loop too. Returns (first 200 bytes, total size).
+    """
+    f = await asyncio.to_thread(open, part_path, 'wb')
+    head = b''
+    total = 0
+    buf = bytearray()
+    try:
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            if len(head) < 200:
+                head += chunk[:200 - len(head)]
+            buf += chunk
+            total += len(chunk)
+            if len(buf) >= STREAM_WRITE_BUFFER:
+                await asyncio.to_thread(f.write, buf)
+                buf.clear()
+        if buf:
+            await asyncio.to_thread(f.write, buf)
+    finally:
+        await asyncio.to_thread(f.close)
+    return head, total
+
 def setup_database():
     MUSIC_DIR.mkdir(parents=True, exist_ok=True)
-    if not DB_FILE.exists():
-        with open(DB_FILE, 'w') as f:
-            json.dump({}, f)
+    # Exclusive create: checking and creating is one atomic step, so this can never
+    # truncate a DB that appeared in between
+    try:
+        with open(DB_FILE, 'xb') as f:
+            f.write(_json_dumps({}))
+    except FileExistsError:
+        pass
+
+# In-memory copy of DB_FILE as ((mtime_ns, size), data), re-read only when the file changes
+_db_cache = None
+
+def _copy_db(data):
+    """Copy the DB down to the song dicts, which is all callers ever mutate"""
+    copied = {}
+    for playlist_id, playlist_data in data.items():
+        playlist_copy = dict(playlist_data)
+        if 'songs' in playlist_copy:
+            playlist_copy['songs'] = [dict(song) for song in playlist_copy['songs']]
+        copied[playlist_id] = playlist_copy
+    return copied
+
+def load_db(readonly: bool = False):
+    """Load the playlist DB (cached until the file changes on disk)
 
-def load_db():
+    Pass readonly=True from handlers that only render the DB; they get the cached
+    object itself and must not mutate it.
+    """
+    global _db_cache
     try:
-        with open(DB_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        logger.error(f"Database corrupted or missing: {e}")
+        st = DB_FILE.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cache = _db_cache
+        if cache is None or cache[0] != key:
+            with open(DB_FILE, 'rb') as f:
+                cache = (key, _json_loads(f.read()))
+            _db_cache = cache
+        if readonly:
+            return cache[1]
+        # Callers mutate and save the result, so hand out a copy
+        return _copy_db(cache[1])
+    except FileNotFoundError:
+        # Nothing saved yet; the first save_db creates the file
+        return {}
+    except json.JSONDecodeError as e:
+        # Saves go through os.replace, so readers never see a half-written file:
+        # this is real corruption, not a race with a writer
+        logger.error(f"Database corrupted: {e}")
         # Create backup of corrupted file
-        if DB_FILE.exists():
-            backup_path = DB_FILE.with_suffix('.json.corrupted')
-            DB_FILE.rename(backup_path)
-            logger.info(f"Corrupted database backed up to: {backup_path}")
+        with _db_write_lock:
+            try:
+                backup_path = DB_FILE.with_suffix('.json.corrupted')
+                DB_FILE.rename(backup_path)
+                logger.info(f"Corrupted database backed up to: {backup_path}")
+            except FileNotFoundError:
+                pass  # Another caller already moved it aside
 
         # Return empty database
         logger.info("Creating new empty database")
         return {}
 
 def remove_duplicates_from_playlist(songs: list) -> list:
-    """Remove duplicate songs based on URL"""
-    seen_urls = set()
-    unique_songs = []
+    """Remove duplicate songs based on URL (first occurrence wins, order preserved)
 
+    Songs without a URL are dropped. Callers log the removed count.
+    """
+    # Saves run this on every playlist and duplicates are rare: when every URL is
+    # present and distinct, hand the list back as-is
+    urls = [song.get('url') for song in songs]
+    if all(urls) and len(set(urls)) == len(urls):
+        return songs
+
+    unique_songs = {}
     for song in songs:
-        song_url = song.get('url', '')
-        if song_url and song_url not in seen_urls:
-            seen_urls.add(song_url)
-            unique_songs.append(song)
-        else:
-            logger.debug(f"Skipping duplicate song: {song.get('artist', 'Unknown')} - {song.get('title', 'Unknown')}")
+        song_url = song.get('url')
+        if song_url and song_url not in unique_songs:
+            unique_songs[song_url] = song
+    return list(unique_songs.values())
 
-    return unique_songs
+# Serializes writers of DB_FILE now that saves can run in worker threads
+_db_write_lock = threading.Lock()
+_db_backup_at = None  # monotonic() of the last playlist_db.json.backup refresh
 
 def save_db(data):
+    with _db_write_lock:
+        _save_db_locked(data)
+
+async def save_db_async(data):
+    """save_db in a worker thread, so large DBs don't stall the bot
+
+    Only pass a dict no other task mutates meanwhile (e.g. a handler's own load_db() result).
+    """
+    await asyncio.to_thread(save_db, data)
+
+def _save_db_locked(data):
+    global _db_cache, _db_backup_at
     try:
         # Clean duplicates before saving
         for playlist_id, playlist_data in data.items():
@@ -276,30 +453,90 @@ def save_db(data):
                     playlist_name = playlist_data.get('name', 'Unknown')
                     logger.info(f"Removed {removed_count} duplicate songs from {playlist_name} before saving")
 
-        # Create backup of current database before saving
-        if DB_FILE.exists():
+        # Handlers often save a DB they loaded but didn't change: when it still matches
+        # what is on disk, skip the serialize, backup, fsync and rename altogether
+        cache = _db_cache
+        if cache is not None and data == cache[1]:
+            try:
+                st = DB_FILE.stat()
+                if (st.st_mtime_ns, st.st_size) == cache[0]:
+                    logger.debug("Database unchanged, skipping save")
+                    return
+            except FileNotFoundError:
+                pass
+
+        # Back up the current database before saving (first save of this run, then at
+        # most once per interval, so a burst of saves can't roll a bad write into the
+        # backup too). The live file is about to be swapped out by os.replace, so a hard
+        # link keeps its contents without reading or writing a byte
+        now = monotonic()
+        if _db_backup_at is None or now - _db_backup_at >= DB_BACKUP_INTERVAL_SECONDS:
             backup_path = DB_FILE.with_suffix('.json.backup')
-            with open(DB_FILE, 'r') as src, open(backup_path, 'w') as dst:
-                dst.write(src.read())
+            try:
+                backup_path.unlink(missing_ok=True)
+                os.link(DB_FILE, backup_path)
+                _db_backup_at = now
+            except FileNotFoundError:
+                pass  # No DB yet, nothing to back up
+            except OSError:
+                # Filesystem without hard links; copyfile still copies in the kernel
+                shutil.copyfile(DB_FILE, backup_path)
+                _db_backup_at = now
+
+        # Write to a temp file and swap it in, so a failed save never truncates the DB
+        tmp_path = DB_FILE.with_suffix('.json.tmp')
+        if ORJSON_AVAILABLE:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            # The stdlib encoder would build the whole document as one str first; json.dump
+            # writes it out chunk by chunk, so large DBs don't need a second full copy in memory
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, DB_FILE)
 
-        # Save new data
-        with open(DB_FILE, 'w') as f:
-            json.dump(data, f, indent=4)
+        st = DB_FILE.stat()
+        _db_cache = ((st.st_mtime_ns, st.st_size), _copy_db(data))
 
         logger.debug("Database saved successfully")
 
     except Exception as e:
         logger.error(f"Error saving database: {e}")
-        # Try to restore backup if save failed
-        backup_path = DB_FILE.with_suffix('.json.backup')
-        if backup_path.exists():
-            backup_path.rename(DB_FILE)
-            logger.info("Restored database from backup due to save error")
+        # The live DB file is untouched by a failed save; just drop the partial temp file
+        tmp_path = DB_FILE.with_suffix('.json.tmp')
+        if tmp_path.exists():
+            tmp_path.unlink()
         raise
 
-def load_settings():
-    """Load bot settings from file"""
-    if not SETTINGS_FILE.exists():
+# In-memory copy of SETTINGS_FILE, re-read only when the file's mtime changes
+_settings_cache = None
+_settings_mtime = None
+_settings_checked_at = None  # monotonic() of the last stat that validated the cache
+
+def load_settings(readonly: bool = False):
+    """Load bot settings from file (cached until the file changes on disk)
+
+    Pass readonly=True from code that only reads settings; it gets the cached dict
+    itself and must not mutate it.
+    """
+    global _settings_cache, _settings_mtime, _settings_checked_at
+
+    # Saves from this process update the cache directly; only hand edits to the file
+    # need the stat, and a couple of seconds' delay on those is fine. Saves a syscall
+    # per song, since get_download_priority runs for every download
+    now = monotonic()
+    if _settings_cache is not None and _settings_checked_at is not None \
+            and now - _settings_checked_at < SETTINGS_RECHECK_SECONDS:
+        return _settings_cache if readonly else dict(_settings_cache)
+
+    # One stat both detects a missing file and validates the cache
+    try:
+        mtime = SETTINGS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         default_settings = {
             'sync_enabled': False,
             'sync_day': 'monday',  # monday to sunday
@@ -309,21 +546,59 @@ def load_settings():
             'notify_sync_results': True  # Send notifications for auto sync results
         }
         save_settings(default_settings)
-        return default_settings
+        return dict(default_settings)
+
+    if _settings_cache is None or mtime != _settings_mtime:
+        with open(SETTINGS_FILE, 'rb') as f:
+            _settings_cache = _json_loads(f.read())
+        _settings_mtime = mtime
+    _settings_checked_at = now
+
+    if readonly:
+        return _settings_cache
+    # Callers mutate and save the result, so hand out a copy
+    return dict(_settings_cache)
 
-    with open(SETTINGS_FILE, 'r') as f:
-        return json.load(f)
+# Serializes writers of SETTINGS_FILE, which share one temp file
+_settings_write_lock = threading.Lock()
 
 def save_settings(settings):
     """Save bot settings to file"""
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=4)
+    global _settings_cache, _settings_mtime, _settings_checked_at
+
+    with _settings_write_lock:
+        # Nothing to write if this is what's already on disk (e.g. a priority move that
+        # hit the end of the list); skips the temp file, fsync and rename entirely
+        if settings == _settings_cache and _settings_mtime is not None:
+            try:
+                if SETTINGS_FILE.stat().st_mtime_ns == _settings_mtime:
+                    return
+            except FileNotFoundError:
+                pass
+
+        # Settings stay pretty-printed since they are meant to be hand-editable. Written
+        # to a temp file and swapped in, so load_settings never parses a half-written file
+        tmp_path = SETTINGS_FILE.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(settings, pretty=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SETTINGS_FILE)
+
+        _settings_cache = dict(settings)
+        _settings_mtime = SETTINGS_FILE.stat().st_mtime_ns
+        _settings_checked_at = monotonic()
+
+async def save_settings_async(settings):
+    """save_settings in a worker thread, for use from handlers and jobs"""
+    await asyncio.to_thread(save_settings, settings)
 
 def get_download_priority():
     """Get current download methods priority order"""
-    settings = load_settings()
+    settings = load_settings(readonly=True)
     default_priority = ['spotify_youtube_ytdlp', 'spotdl', 'spotdown']
-    return settings.get('download_priority', default_priority)
+    # A fresh list, since the priority screen reorders it in place
+    return list(settings.get('download_priority', default_priority))
 
 def set_download_priority(new_priority):
     """Set new download methods priority order"""
@@ -331,11 +606,12 @@ def set_download_priority(new_priority):
     settings['download_priority'] = new_priority
     save_settings(settings)
 
+@functools.lru_cache(maxsize=1)
 def get_available_methods():
-    """Get list of currently available download methods"""
+    """Get list of currently available download methods (computed once; don't mutate it)"""
     available = []
     for method_id, method_info in DOWNLOAD_METHODS.items():
-        if method_info['available']():
+        if method_info['available']:
             available.append({
                 'id': method_id,
                 'name': method_info['name'],
@@ -343,27 +619,76 @@ def get_available_methods():
             })
     return available
 
+# Compiled once; sanitize_filename runs several times per song on every sync/check
+_INVALID_FS = re.compile(r'[\\/*?:"<>|]')
+_WS = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=16384)
 def sanitize_filename(name: str) -> str:
-    """Removes invalid characters from file/folder names."""
-    if not name or name.strip() == '':
-        return "Unknown"
+    """Removes invalid characters from file/folder names (memoized, inputs repeat across sync/check/fix)."""
+    stripped = name.strip() if name else ''
 
-    # Remove invalid filesystem characters but keep Unicode characters
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", name.strip())
+    # Remove invalid filesystem characters (keeping Unicode)
+    sanitized = _INVALID_FS.sub('', stripped)
 
-    # Replace multiple spaces with single space
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    # Collapse whitespace only when there is some to collapse: every whitespace
+    # character except ' ' is non-printable, so typical titles skip the regex
+    if '  ' in sanitized or not sanitized.isprintable():
+        sanitized = _WS.sub(' ', sanitized)
 
-    # If the result is empty after sanitization, return Unknown
-    if not sanitized:
-        return "Unknown"
+    # Empty input, or nothing left after sanitization
+    return sanitized or "Unknown"
 
-    return sanitized
+def list_dir_files(directory: Path) -> set:
+    """Names of the files in a directory from a single scandir (empty if it doesn't exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
 
 # --- SONG INTEGRITY CHECKER ---
-async def check_song_integrity(file_path: Path, expected_duration: str) -> bool:
+# playlist_id -> (monotonic time of the last clean check, folder fingerprint at that time)
+_integrity_clean = {}
+
+# Shared by every integrity check, so "Check All Playlists" (several playlists at once)
+# still runs at most one file probe per core instead of one per core per playlist
+_integrity_probe_sem = asyncio.Semaphore(os.cpu_count() or 4)
+
+# Without mutagen, sizes in this band (bytes per expected second) skip ffprobe: even at
+# 320 kbps the file is over half the expected length, even at 128 kbps under 3x
+MIN_PROBE_FREE_BYTES_PER_SEC = 320 * 1000 // 8 // 2
+MAX_PROBE_FREE_BYTES_PER_SEC = 128 * 1000 // 8 * 3
+
+def _has_audio_header(file_path: Path) -> bool:
+    """Whether a file starts like an MP3, MP4, Ogg or FLAC file (blocking)"""
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(16)  # Read more bytes for better detection
+
+        # Check for common audio file headers
+        is_mp3 = header.startswith(b'ID3') or header[0:2] == b'\xff\xfb' or header[0:2] == b'\xff\xfa'
+        is_mp4 = header[4:8] == b'ftyp'
+        is_ogg = header.startswith(b'OggS')
+        is_flac = header.startswith(b'fLaC')
+
+        if is_mp3 or is_mp4 or is_ogg or is_flac:
+            # Looks like a valid audio file
+            logger.debug(f"Valid audio header detected - {file_path.name}")
+            return True
+        else:
+            logger.warning(f"Invalid or unrecognized audio header - {file_path.name}")
+            return False
+
+    except Exception as e:
+        logger.error(f"Error reading file header for {file_path.name}: {e}")
+        return False
+
+def check_song_integrity(file_path: Path, expected_duration: str) -> bool:
     """Check if a song file is complete and not corrupted
 
+    Blocking (stat, mutagen parsing or ffprobe); run it via asyncio.to_thread.
+
     Enhanced for YouTube downloads which may have different durations:
     - Uses intelligent tolerance for duration differences (35-50% depending on song length)
     - Distinguishes between corrupted files and different versions
@@ -378,12 +703,12 @@ async def check_song_integrity(file_path: Path, expected_duration: str) -> bool:
         bool: True if file appears valid, False if likely corrupted
     """
     try:
-        if not file_path.exists():
+        # One stat both checks existence and gets the size
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             return False
 
-        # Get file size
-        file_size = file_path.stat().st_size
-
         # Very small files are likely corrupted (less than 500KB for any song is suspicious)
         min_file_size = 500 * 1024  # Increased from 100KB to 500KB for YouTube downloads
         if file_size < min_file_size:
@@ -391,6 +716,7 @@ async def check_song_integrity(file_path: Path, expected_duration: str) -> bool:
             return False
 
         # Parse expected duration to estimate minimum expected file size
+        expected_total_seconds = None
         duration_parts = expected_duration.split(':')
         if len(duration_parts) == 2:
             try:
@@ -411,90 +737,92 @@ async def check_song_integrity(file_path: Path, expected_duration: str) -> bool:
             except (ValueError, IndexError):
                 pass  # If we can't parse duration, just rely on minimum size check
 
-        # Try to use ffprobe if available, otherwise rely on file size check
-        try:
-            cmd = [
-                'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-                '-of', 'csv=p=0', str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                actual_duration = float(result.stdout.strip())
-
-                # Parse expected duration
-                if len(duration_parts) == 2:
-                    expected_minutes = int(duration_parts[0])
-                    expected_seconds = int(duration_parts[1])
-                    expected_total_seconds = expected_minutes * 60 + expected_seconds
-
-                    # Intelligent tolerance calculation for YouTube downloads
-                    # YouTube often has different versions (extended, live, remixes, etc.)
-
-                    # Base tolerance: larger for longer songs
-                    if expected_total_seconds < 120:  # Songs under 2 minutes
-                        tolerance_percentage = 0.50  # 50% tolerance
-                    elif expected_total_seconds < 300:  # Songs under 5 minutes
-                        tolerance_percentage = 0.40  # 40% tolerance
-                    else:  # Longer songs
-                        tolerance_percentage = 0.35  # 35% tolerance
-
-                    # Minimum tolerance of 15 seconds
-                    tolerance = max(15, expected_total_seconds * tolerance_percentage)
-                    duration_diff = abs(actual_duration - expected_total_seconds)
-
-                    # Check if file is suspiciously short (likely corrupted)
-                    is_too_short = actual_duration < expected_total_seconds * 0.5
-
-                    # Check if file is way too long (likely wrong song or compilation)
-                    is_too_long = actual_duration > expected_total_seconds * 3
-
-                    # File is invalid only if clearly corrupted or completely wrong
-                    is_valid = not (is_too_short or is_too_long)
-
-                    if not is_valid:
-                        if is_too_short:
-                            logger.warning(f"Possibly corrupted (too short) - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s")
-                        elif is_too_long:
-                            logger.info(f"Possibly wrong track (too long) - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s")
-                    elif duration_diff > tolerance:
-                        # Log as info but don't mark as invalid (different version, not corrupted)
-                        percentage_diff = (duration_diff / expected_total_seconds) * 100
-                        logger.info(f"Different version detected - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s ({percentage_diff:.1f}% difference)")
-                        # Still consider valid since it's likely just a different version
-                        is_valid = True
-
-                    return is_valid
-
-        except (FileNotFoundError, subprocess.SubprocessError, subprocess.TimeoutExpired):
-            # ffprobe not available or failed, rely on file size and header check
-            logger.debug(f"ffprobe not available for {file_path.name}, using basic validation")
+        # Read the real duration in-process with mutagen (which also validates the
+        # audio headers); fall back to an ffprobe subprocess when it isn't installed
+        actual_duration = None
+        if MUTAGEN_AVAILABLE:
+            try:
+                audio = MutagenFile(str(file_path))
+            except MutagenError as e:
+                logger.warning(f"Unreadable audio file (likely corrupted) - {file_path.name}: {e}")
+                return False
 
-        # If we can't use ffprobe, check if the file is a valid audio file by reading its header
-        try:
-            with open(file_path, 'rb') as f:
-                header = f.read(16)  # Read more bytes for better detection
-
-            # Check for common audio file headers
-            is_mp3 = header.startswith(b'ID3') or header[0:2] == b'\xff\xfb' or header[0:2] == b'\xff\xfa'
-            is_mp4 = header[4:8] == b'ftyp'
-            is_ogg = header.startswith(b'OggS')
-            is_flac = header.startswith(b'fLaC')
-
-            if is_mp3 or is_mp4 or is_ogg or is_flac:
-                # Looks like a valid audio file
-                logger.debug(f"Valid audio header detected - {file_path.name}")
-                return True
-            else:
+            if audio is None or audio.info is None:
                 logger.warning(f"Invalid or unrecognized audio header - {file_path.name}")
                 return False
 
-        except Exception as e:
-            logger.error(f"Error reading file header for {file_path.name}: {e}")
-            return False
+            actual_duration = audio.info.length
+        elif expected_total_seconds and \
+                expected_total_seconds * MIN_PROBE_FREE_BYTES_PER_SEC <= file_size <= expected_total_seconds * MAX_PROBE_FREE_BYTES_PER_SEC:
+            # At any common MP3 bitrate (128-320 kbps) this size already means a duration
+            # the check below would accept, so a valid header is enough; skip the ffprobe spawn
+            return _has_audio_header(file_path)
+        else:
+            try:
+                cmd = [
+                    'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
+                    '-of', 'csv=p=0', str(file_path)
+                ]
 
-        # If all checks pass and we can't verify otherwise, assume valid
-        return True
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                if result.returncode == 0:
+                    actual_duration = float(result.stdout.strip())
+
+            except (FileNotFoundError, subprocess.SubprocessError, subprocess.TimeoutExpired):
+                # ffprobe not available or failed, rely on file size and header check
+                logger.debug(f"ffprobe not available for {file_path.name}, using basic validation")
+
+        if actual_duration is not None:
+            # Parse expected duration
+            if len(duration_parts) == 2:
+                expected_minutes = int(duration_parts[0])
+                expected_seconds = int(duration_parts[1])
+                expected_total_seconds = expected_minutes * 60 + expected_seconds
+
+                # Intelligent tolerance calculation for YouTube downloads
+                # YouTube often has different versions (extended, live, remixes, etc.)
+
+                # Base tolerance: larger for longer songs
+                if expected_total_seconds < 120:  # Songs under 2 minutes
+                    tolerance_percentage = 0.50  # 50% tolerance
+                elif expected_total_seconds < 300:  # Songs under 5 minutes
+                    tolerance_percentage = 0.40  # 40% tolerance
+                else:  # Longer songs
+                    tolerance_percentage = 0.35  # 35% tolerance
+
+                # Minimum tolerance of 15 seconds
+                tolerance = max(15, expected_total_seconds * tolerance_percentage)
+                duration_diff = abs(actual_duration - expected_total_seconds)
+
+                # Check if file is suspiciously short (likely corrupted)
+                is_too_short = actual_duration < expected_total_seconds * 0.5
+
+                # Check if file is way too long (likely wrong song or compilation)
+                is_too_long = actual_duration > expected_total_seconds * 3
+
+                # File is invalid only if clearly corrupted or completely wrong
+                is_valid = not (is_too_short or is_too_long)
+
+                if not is_valid:
+                    if is_too_short:
+                        logger.warning(f"Possibly corrupted (too short) - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s")
+                    elif is_too_long:
+                        logger.info(f"Possibly wrong track (too long) - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s")
+                elif duration_diff > tolerance:
+                    # Log as info but don't mark as invalid (different version, not corrupted)
+                    percentage_diff = (duration_diff / expected_total_seconds) * 100
+                    logger.info(f"Different version detected - {file_path.name}: expected {expected_total_seconds}s, got {actual_duration:.1f}s ({percentage_diff:.1f}% difference)")
+                    # Still consider valid since it's likely just a different version
+                    is_valid = True
+
+                return is_valid
+
+        if MUTAGEN_AVAILABLE:
+            # mutagen already parsed the headers; nothing left to compare against
+            return True
+
+        # If we can't use ffprobe, check if the file is a valid audio file by reading its header
+        return _has_audio_header(file_path)
 
     except Exception as e:
         logger.warning(f"Error checking integrity of {file_path}: {e}")
@@ -505,6 +833,7 @@ async def check_playlist_integrity(playlist_id: str, playlist_data: dict) -> dic
     playlist_name = playlist_data.get('name', 'Unknown')
     playlist_dir = MUSIC_DIR / playlist_name
     songs = playlist_data.get('songs', [])
+    source = playlist_data.get('source', 'spotify')
 
     result = {
         'total_songs': len(songs),
@@ -516,39 +845,67 @@ async def check_playlist_integrity(playlist_id: str, playlist_data: dict) -> dic
 
     logger.info(f"Starting integrity check for playlist: {playlist_name}")
 
+    def _scan():
+        # One directory listing instead of an exists() call per song
+        files = list_dir_files(playlist_dir)
+        try:
+            return files, (playlist_dir.stat().st_mtime_ns, len(songs), len(files))
+        except FileNotFoundError:
+            return files, None
+
+    # Directory I/O is blocking too, so keep it off the event loop like the file probes
+    existing_files, fingerprint = await asyncio.to_thread(_scan)
+
+    to_check = []
     for song in songs:
-        song_title = sanitize_filename(song.get('title', 'Unknown'))
-        artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-        duration = song.get('duration', '0:00')
-        file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
-
-        if not file_path.exists():
-            result['missing_songs'].append({
-                'title': song_title,
-                'artist': artist_name,
-                'file_path': str(file_path),
-                'song_data': song
-            })
-            continue
+        # Same naming the downloaders use, so YouTube playlists ("Title.mp3") aren't
+        # reported as entirely missing
+        file_name = song_filename(song, source)
+        entry = {
+            'title': sanitize_filename(song.get('title', 'Unknown')),
+            'artist': sanitize_filename(song.get('artist', 'Unknown')),
+            'file_path': str(playlist_dir / file_name),
+            'song_data': song
+        }
+
+        if file_name not in existing_files:
+            result['missing_songs'].append(entry)
+        else:
+            to_check.append(entry)
+
+    # Downloads land via os.replace, which bumps the folder mtime. If nothing is missing and
+    # the folder hasn't changed since a recent clean check, skip re-probing every file
+    cached = _integrity_clean.get(playlist_id)
+    if (not result['missing_songs'] and fingerprint is not None and cached
+            and cached[1] == fingerprint and monotonic() - cached[0] < INTEGRITY_CACHE_TTL_SECONDS):
+        result['valid_songs'] = result['checked_songs'] = len(to_check)
+        logger.info(f"Integrity check for {playlist_name}: unchanged since last clean check, skipping file probes")
+        return result
+
+    # ffprobe and file reads are blocking, so check files concurrently in worker threads
+    async def _check(entry):
+        async with _integrity_probe_sem:
+            return await asyncio.to_thread(
+                check_song_integrity, Path(entry['file_path']), entry['song_data'].get('duration', '0:00')
+            )
 
-        result['checked_songs'] += 1
+    outcomes = await asyncio.gather(*[_check(entry) for entry in to_check])
 
-        is_valid = await check_song_integrity(file_path, duration)
+    result['checked_songs'] = len(to_check)
+    for entry, is_valid in zip(to_check, outcomes):
         if is_valid:
             result['valid_songs'] += 1
         else:
-            result['corrupted_songs'].append({
-                'title': song_title,
-                'artist': artist_name,
-                'file_path': str(file_path),
-                'song_data': song
-            })
+            result['corrupted_songs'].append(entry)
 
     # Calculate statistics
     total_issues = len(result['corrupted_songs']) + len(result['missing_songs'])
     if total_issues == 0:
+        if fingerprint is not None:
+            _integrity_clean[playlist_id] = (monotonic(), fingerprint)
         logger.info(f"Integrity check completed for {playlist_name}: ✅ All {result['valid_songs']} songs are valid")
     else:
+        _integrity_clean.pop(playlist_id, None)
         logger.info(f"Integrity check completed for {playlist_name}: {result['valid_songs']}/{result['checked_songs']} valid, {len(result['corrupted_songs'])} potentially corrupted, {len(result['missing_songs'])} missing")
 
     return result
@@ -572,13 +929,21 @@ async def fix_corrupted_songs(playlist_id: str, corrupted_songs: list, missing_s
     # Collect all songs that need to be re-downloaded
     songs_to_fix = []
 
-    # Add corrupted songs
-    for corrupted in corrupted_songs:
-        file_path = Path(corrupted['file_path'])
-        if file_path.exists():
-            file_path.unlink()  # Remove corrupted file
-            result['removed_files'] += 1
+    def _remove_files():
+        removed = 0
+        for corrupted in corrupted_songs:
+            file_path = Path(corrupted['file_path'])
+            try:
+                file_path.unlink()  # Remove corrupted file
+            except FileNotFoundError:
+                continue
+            removed += 1
             logger.info(f"Removed corrupted file: {file_path}")
+        return removed
+
+    # Add corrupted songs (their files are removed in a worker thread)
+    result['removed_files'] = await asyncio.to_thread(_remove_files)
+    for corrupted in corrupted_songs:
         songs_to_fix.append(corrupted['song_data'])
 
     # Add missing songs
@@ -587,29 +952,41 @@ async def fix_corrupted_songs(playlist_id: str, corrupted_songs: list, missing_s
 
     result['songs_to_redownload'] = songs_to_fix
 
-    # Re-download songs
+    # Re-download songs concurrently, bounded by the download pool size
     playlist_dir = MUSIC_DIR / playlist_name
-    for song in songs_to_fix:
+    sem = asyncio.Semaphore(MAX_DOWNLOAD_CONCURRENCY)
+
+    source = playlist_data.get('source', 'spotify')
+
+    async def _redownload(song):
         try:
-            song_title = sanitize_filename(song.get('title', 'Unknown'))
-            artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-            file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
+            file_path = playlist_dir / song_filename(song, source)
 
-            success = await api_client.download_song(song, file_path)
+            async with sem:
+                if source == 'youtube':
+                    success = await asyncio.to_thread(download_audio_ytdlp, song['url'], str(file_path.with_suffix('')))
+                else:
+                    success = await api_client.download_song(song, file_path)
             if success:
-                result['redownloaded'] += 1
-                logger.info(f"Re-downloaded: {artist_name} - {song_title}")
+                logger.info(f"Re-downloaded: {file_path.stem}")
             else:
-                result['failed_downloads'] += 1
-                logger.warning(f"Failed to re-download: {artist_name} - {song_title}")
+                logger.warning(f"Failed to re-download: {file_path.stem}")
+            return success
 
         except Exception as e:
-            result['failed_downloads'] += 1
             logger.error(f"Error re-downloading {song.get('title', 'Unknown')}: {e}")
+            return False
+
+    outcomes = await asyncio.gather(*[_redownload(song) for song in songs_to_fix])
+    result['redownloaded'] = sum(1 for success in outcomes if success)
+    result['failed_downloads'] = len(outcomes) - result['redownloaded']
 
     return result
 
 # --- FREE PROXY SYSTEM ---
+# One "ip:port" entry per line in the public proxy lists
+_PROXY_RE = re.compile(r'^[ \t]*(\d{1,3}(?:\.\d{1,3}){3}:\d{2,5})[ \t\r]*$', re.M)
+
 class ProxyManager:
     """Manages free proxy servers for API requests - Enhanced for long playlists"""
 
@@ -621,60 +998,107 @@ class ProxyManager:
             "https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/http.txt"
         ]
         self.proxies = []
-        self.working_proxies = []  # Cache of verified working proxies
+        self.working_proxies = deque()  # Verified working proxies; the head is the next one handed out
         self.failed_proxies = set()  # Track failed proxies to avoid them temporarily
         self.last_update = None
-        self.proxy_index = 0  # For rotation
         self.requests_per_proxy = 0  # Track requests per proxy
         self.max_requests_per_proxy = 15  # Switch proxy after X requests to avoid rate limits
+        self._verified_at: Dict[str, float] = {}  # proxy -> monotonic time of its last passed test
+        self._latency: Dict[str, float] = {}  # proxy -> seconds its last passed test took
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._probing: Set[str] = set()  # Proxies with a test in flight
+        self._probe_tasks: Set[asyncio.Task] = set()  # Strong refs to background probes
+        self._refresh_task: Optional[asyncio.Task] = None  # Proxy list refresh in flight
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Shared, lazily created HTTP session so connections and DNS lookups are pooled"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60),
+                cookie_jar=aiohttp.DummyCookieJar()  # Keep calls independent, like the old per-call sessions
+            )
+        return self._http
+
+    async def aclose(self):
+        """Stop background probes and close the shared HTTP session"""
+        for task in self._probe_tasks:
+            task.cancel()
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
 
     async def get_working_proxy(self, context: ContextTypes.DEFAULT_TYPE = None, force_new=False):
         """Get a working proxy from available sources - Enhanced with rotation"""
         try:
             # Update proxy list every 20 minutes (more frequent for long lists)
             if not self.proxies or not self.last_update or \
-               (datetime.now() - self.last_update).total_seconds() > 1200:
-                await self._update_proxies()
+               monotonic() - self.last_update > 1200:
+                # Callers arriving during a refresh wait on it instead of refetching
+                if self._refresh_task is None or self._refresh_task.done():
+                    self._refresh_task = asyncio.create_task(self._update_proxies())
+                await asyncio.shield(self._refresh_task)
 
             # If we've used current proxy too much, force rotation
             if self.requests_per_proxy >= self.max_requests_per_proxy:
                 force_new = True
                 self.requests_per_proxy = 0
 
-            # If we have working proxies cached and don't need new one, rotate through them
-            if self.working_proxies and not force_new:
-                proxy = self.working_proxies[self.proxy_index % len(self.working_proxies)]
-                self.proxy_index = (self.proxy_index + 1) % len(self.working_proxies)
-                self.requests_per_proxy += 1
-                logger.debug(f"Using cached proxy: {proxy} (request #{self.requests_per_proxy})")
-                return proxy
-
-            # Test and cache working proxies (test more proxies for better pool)
-            tested_count = 0
-            max_tests = min(25, len(self.proxies))  # Test more proxies
-
-            for proxy in self.proxies:
-                if proxy in self.failed_proxies:
+            # If we have recently verified proxies and don't need a new one, rotate through
+            # them: take the head and move it to the back, passing over expired ones
+            now = monotonic()
+            if not force_new:
+                for _ in range(len(self.working_proxies)):
+                    proxy = self.working_proxies[0]
+                    self.working_proxies.rotate(-1)
+                    if now - self._verified_at.get(proxy, 0) < PROXY_ALIVE_TTL_SECONDS:
+                        self.requests_per_proxy += 1
+                        logger.debug(f"Using cached proxy: {proxy} (request #{self.requests_per_proxy})")
+                        return proxy
+
+            # Re-test expired pool members first, then fill up with random candidates,
+            # concurrently, and take whichever answers first
+            stale = [proxy for proxy in self.working_proxies
+                     if now - self._verified_at.get(proxy, 0) >= PROXY_ALIVE_TTL_SECONDS
+                     and proxy not in self._probing]
+            # One set of everything to leave out, so the pass over the (thousands of) listed
+            # proxies is a single hash lookup each rather than a scan of the pool deque
+            excluded = self.failed_proxies.union(self.working_proxies, self._probing)
+            available = [proxy for proxy in self.proxies if proxy not in excluded]
+            candidates = stale[:25] + random.sample(available, min(25 - len(stale[:25]), len(available)))
+            tested_count = len(candidates)
+
+            sem = asyncio.Semaphore(PROXY_TEST_CONCURRENCY)
+
+            async def _probe(proxy):
+                try:
+                    async with sem:
+                        started = monotonic()
+                        is_working = await self._test_proxy(proxy)
+                    self._record_probe(proxy, is_working, monotonic() - started)
+                    return proxy, is_working
+                finally:
+                    self._probing.discard(proxy)
+
+            self._probing.update(candidates)
+            tasks = [asyncio.create_task(_probe(proxy)) for proxy in candidates]
+            # Probes still running once a winner is found keep filling the pool in the
+            # background, so the next rotation usually finds fresh proxies without testing
+            self._probe_tasks.update(tasks)
+            for task in tasks:
+                task.add_done_callback(self._probe_tasks.discard)
+
+            for next_done in asyncio.as_completed(tasks):
+                proxy, is_working = await next_done
+                if not is_working:
                     continue
 
-                if tested_count >= max_tests:
-                    break
-
-                tested_count += 1
-                if await self._test_proxy(proxy):
-                    if proxy not in self.working_proxies:
-                        self.working_proxies.append(proxy)
-                        logger.info(f"Added working proxy to pool: {proxy}")
-
-                    # Clean failed proxies periodically
-                    if len(self.failed_proxies) > 50:
-                        self.failed_proxies.clear()
-                        logger.info("Cleared failed proxies cache")
+                # Clean failed proxies periodically
+                if len(self.failed_proxies) > 50:
+                    self.failed_proxies.clear()
+                    logger.info("Cleared failed proxies cache")
 
-                    self.requests_per_proxy = 1
-                    return proxy
-                else:
-                    self.failed_proxies.add(proxy)
+                self.requests_per_proxy = 1
+                return proxy
 
             logger.warning(f"No working proxies found after testing {tested_count} proxies")
             return None
@@ -683,30 +1107,49 @@ class ProxyManager:
             logger.error(f"Error getting proxy: {e}")
             return None
 
+    def _record_probe(self, proxy: str, is_working: bool, elapsed: float):
+        """Add a proxy that passed its test to the pool, or drop one that failed"""
+        if not is_working:
+            self.failed_proxies.add(proxy)
+            if proxy in self.working_proxies:
+                self.working_proxies.remove(proxy)
+                self._verified_at.pop(proxy, None)
+                self._latency.pop(proxy, None)
+                logger.info(f"Dropped dead proxy from pool: {proxy}")
+            return
+
+        self._verified_at[proxy] = monotonic()
+        self._latency[proxy] = elapsed
+        if proxy not in self.working_proxies:
+            self.working_proxies.append(proxy)
+            logger.info(f"Added working proxy to pool: {proxy}")
+        # Rotate through the fastest proxies first
+        self.working_proxies = deque(sorted(self.working_proxies, key=lambda p: self._latency.get(p, float('inf'))))
+
     async def _update_proxies(self):
         """Update proxy list from sources"""
         try:
-            import aiohttp
-            self.proxies = []
+            session = await self._get_http()
 
-            async with aiohttp.ClientSession() as session:
-                for source in self.proxy_sources:
-                    try:
-                        async with session.get(source, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                            if response.status == 200:
-                                text = await response.text()
-                                # Parse proxy list
-                                for line in text.strip().split('\n'):
-                                    line = line.strip()
-                                    if ':' in line and len(line.split(':')) == 2:
-                                        self.proxies.append(line)
-                    except Exception as e:
-                        logger.debug(f"Failed to fetch from {source}: {e}")
+            async def _fetch(source):
+                try:
+                    async with session.get(source, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        if response.status == 200:
+                            return await response.text()
+                except Exception as e:
+                    logger.debug(f"Failed to fetch from {source}: {e}")
+                return ''
 
-            # Remove duplicates and shuffle
-            self.proxies = list(set(self.proxies))
-            random.shuffle(self.proxies)
-            self.last_update = datetime.now()
+            # Fetch all sources at once, then pull ip:port lines out in a single pass
+            texts = await asyncio.gather(*[_fetch(source) for source in self.proxy_sources])
+
+            # Remove duplicates (candidates are sampled at random when testing)
+            proxies = list(dict.fromkeys(_PROXY_RE.findall('\n'.join(texts))))
+            if not proxies and self.proxies:
+                logger.warning("All proxy sources failed, keeping the previous proxy list")
+                return
+            self.proxies = proxies
+            self.last_update = monotonic()
 
             logger.info(f"Updated proxy list: {len(self.proxies)} proxies available")
 
@@ -716,17 +1159,16 @@ class ProxyManager:
     async def _test_proxy(self, proxy: str) -> bool:
         """Test if a proxy is working - Faster with reduced timeout"""
         try:
-            import aiohttp
             proxy_url = f"http://{proxy}"
 
             # Use faster timeout for proxy testing to avoid hanging on bad proxies
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "http://httpbin.org/ip",
-                    proxy=proxy_url,
-                    timeout=aiohttp.ClientTimeout(total=3)  # Reduced from 5 to 3 seconds
-                ) as response:
-                    return response.status == 200
+            session = await self._get_http()
+            async with session.get(
+                "http://httpbin.org/ip",
+                proxy=proxy_url,
+                timeout=aiohttp.ClientTimeout(total=3)  # Reduced from 5 to 3 seconds
+            ) as response:
+                return response.status == 200
 
         except Exception:
             return False
@@ -734,7 +1176,6 @@ class ProxyManager:
     async def reset_proxy_stats(self):
         """Reset proxy statistics - useful for long operations"""
         self.requests_per_proxy = 0
-        self.proxy_index = 0
         self.failed_proxies.clear()
         logger.info("Reset proxy statistics for fresh start")
 
@@ -744,8 +1185,7 @@ class ProxyManager:
             'total_proxies': len(self.proxies),
             'working_proxies': len(self.working_proxies),
             'failed_proxies': len(self.failed_proxies),
-            'requests_per_current_proxy': self.requests_per_proxy,
-            'current_proxy_index': self.proxy_index
+            'requests_per_current_proxy': self.requests_per_proxy
         }
 
 # --- PLAYLIST SYNC SYSTEM ---
@@ -755,8 +1195,14 @@ class PlaylistSyncManager:
     def __init__(self, api_client):
         self.api_client = api_client
 
-    async def sync_all_playlists(self, context: ContextTypes.DEFAULT_TYPE = None):
-        """Sync all saved playlists with their online versions"""
+    async def sync_all_playlists(self, context: ContextTypes.DEFAULT_TYPE = None, settings: Dict = None):
+        """Sync all saved playlists with their online versions
+
+        `settings` lets a caller that already loaded them share its copy; they are only
+        read here (last_sync is written to a fresh load at the end of a long sync).
+        """
+        if settings is None:
+            settings = load_settings(readonly=True)
         sync_logger.info("Starting playlist sync process")
 
         try:
@@ -773,111 +1219,60 @@ class PlaylistSyncManager:
             total_playlists = len(syncable_playlists)
             total_in_db = len(db)
             custom_playlists = total_in_db - total_playlists
-            synced_count = 0
-            error_count = 0
-            new_songs_count = 0
-            playlists_with_new_songs = []  # Store detailed info about playlists with new songs
 
             sync_logger.info(f"Found {total_in_db} total playlists, {total_playlists} syncable (excluding custom playlists)")
 
-            for playlist_id, playlist_data in db.items():
-                playlist_name = playlist_data.get('name', 'Unknown')
-                playlist_url = playlist_data.get('url', '')
-                is_custom = playlist_data.get('is_custom', False)
+            # Fetch and diff playlists concurrently, bounded to avoid hammering the APIs
+            sem = asyncio.Semaphore(MAX_SYNC_CONCURRENCY)
+            download_sem = asyncio.Semaphore(MAX_DOWNLOAD_CONCURRENCY)
+            auto_download = settings.get('auto_download_new', False)
+            results = await asyncio.gather(
+                *[self._sync_one(playlist_id, playlist_data, sem, auto_download, download_sem)
+                  for playlist_id, playlist_data in db.items()],
+                return_exceptions=True
+            )
 
-                source = playlist_data.get('source', 'spotify')
+            synced_count = 0
+            error_count = 0
+            new_songs_count = 0
+            playlists_with_new_songs = []  # Store detailed info about playlists with new songs
 
-                # Skip custom playlists without URL (created from individual tracks)
-                if is_custom or not playlist_url:
-                    sync_logger.info(f"Skipping custom playlist without URL: {playlist_name}")
+            for result in results:
+                if isinstance(result, Exception):
+                    sync_logger.error(f"Error syncing playlist: {result}")
+                    error_count += 1
                     continue
 
-                sync_logger.info(f"Syncing playlist: {playlist_name}")
-
-                try:
-                    # Get current online playlist data
-                    if source == 'youtube':
-                        online_data = get_playlist_info(playlist_url)
-                        if not online_data or 'entries' not in online_data:
-                            sync_logger.warning(f"Could not fetch online data for {playlist_name}")
-                            error_count += 1
-                            continue
-                        online_songs_raw = online_data['entries']
-                        online_songs = [{'title': s.get('title', 'Unknown'), 'artist': 'YouTube', 'url': s.get('url'), 'source': 'youtube'} for s in online_songs_raw]
-                    else: # spotify
-                        online_data = await self.api_client.get_playlist_details(playlist_url)
-                        if not online_data or 'songs' not in online_data:
-                            sync_logger.warning(f"Could not fetch online data for {playlist_name}")
-                            error_count += 1
-                            continue
-                        online_songs = online_data['songs']
-
-                    saved_songs = playlist_data.get('songs', [])
-
-                    # Find new songs by comparing URLs AND checking if files actually exist
-                    playlist_dir = MUSIC_DIR / playlist_name
-                    saved_urls = set()
-
-                    # Only consider songs as "saved" if they exist both in JSON AND on disk
-                    for song in saved_songs:
-                        song_url = song.get('url', '')
-                        if song_url:
-                            # Check if file actually exists
-                            if source == 'youtube':
-                                song_title = sanitize_filename(song.get('title', 'Unknown'))
-                                file_path = playlist_dir / f"{song_title}.mp3"
-                            else:
-                                song_title = sanitize_filename(song.get('title', 'Unknown'))
-                                artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-                                file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
-
-                            if file_path.exists():
-                                saved_urls.add(song_url)
-                            else:
-                                sync_logger.info(f"File missing for '{song_title}' - will be re-downloaded")
-
-                    new_songs = [song for song in online_songs if song.get('url', '') not in saved_urls]
-
-                    if new_songs:
-                        sync_logger.info(f"Found {len(new_songs)} new songs in {playlist_name}")
-
-                        # Store detailed information about this playlist
-                        playlists_with_new_songs.append({
-                            'id': playlist_id,
-                            'name': playlist_name,
-                            'new_songs_count': len(new_songs),
-                            'new_songs': new_songs[:3]  # Store first 3 songs for preview
-                        })
-
-                        # Download new songs and only add successful ones to database
-                        settings = load_settings()
-                        if settings.get('auto_download_new', False):
-                            successfully_downloaded = await self._download_new_songs(new_songs, playlist_data, playlist_id)
-                            # Add only successfully downloaded songs to saved data
-                            playlist_data['songs'].extend(successfully_downloaded)
-                            new_songs_count += len(successfully_downloaded)
-                            sync_logger.info(f"Auto-downloaded and saved {len(successfully_downloaded)}/{len(new_songs)} new songs")
-                        else:
-                            # If auto-download is disabled, don't add new songs to database
-                            # They'll be detected again on next sync or manual download
-                            sync_logger.info(f"Auto-download disabled, {len(new_songs)} new songs not downloaded")
-                            new_songs_count += len(new_songs)  # Still count them as "found"
-                    else:
-                        sync_logger.info(f"No new songs found in {playlist_name}")
-
-                    synced_count += 1
-
-                except Exception as e:
-                    sync_logger.error(f"Error syncing {playlist_name}: {e}")
+                status = result['status']
+                if status == 'skipped':
+                    continue
+                if status == 'error':
                     error_count += 1
+                    continue
 
-            # Update database with synced data
-            save_db(db)
+                synced_count += 1
+                new_songs_count += result['new_songs_count']
+                if result['playlist_info']:
+                    playlists_with_new_songs.append(result['playlist_info'])
+
+            # Apply the sync's changes to a fresh load in one write, rather than saving the
+            # snapshot taken before the (possibly long) sync: playlists added, deleted or
+            # edited from the chat meanwhile would otherwise be overwritten
+            changed = [r for r in results
+                       if not isinstance(r, Exception) and r['status'] == 'synced' and r['downloaded']]
+            if changed:
+                fresh_db = load_db()
+                for result in changed:
+                    fresh_data = fresh_db.get(result['playlist_id'])
+                    if fresh_data is None:
+                        continue  # Deleted while the sync ran
+                    fresh_data.setdefault('songs', []).extend(result['downloaded'])
+                await save_db_async(fresh_db)
 
             # Update last sync time
             settings = load_settings()
             settings['last_sync'] = datetime.now().isoformat()
-            save_settings(settings)
+            await save_settings_async(settings)
 
             sync_logger.info(f"Sync completed: {synced_count}/{total_playlists} synced, {new_songs_count} new songs found, {error_count} errors")
 
@@ -895,52 +1290,170 @@ class PlaylistSyncManager:
             sync_logger.error(f"Critical error during sync: {e}")
             return None
 
-    async def _download_new_songs(self, new_songs: List[Dict], playlist_data: Dict, playlist_id: str):
-        """Download newly found songs and return only successfully downloaded ones"""
+    async def _sync_one(self, playlist_id: str, playlist_data: Dict, sem: asyncio.Semaphore, auto_download: bool,
+                        download_sem: asyncio.Semaphore = None) -> Dict:
+        """Sync a single playlist and report its outcome"""
+        playlist_name = playlist_data.get('name', 'Unknown')
+        playlist_url = playlist_data.get('url', '')
+        is_custom = playlist_data.get('is_custom', False)
+
+        source = playlist_data.get('source', 'spotify')
+
+        # Skip custom playlists without URL (created from individual tracks)
+        if is_custom or not playlist_url:
+            sync_logger.info(f"Skipping custom playlist without URL: {playlist_name}")
+            return {'status': 'skipped'}
+
+        try:
+            # Only the fetch holds a sync slot; diffing and downloading (which has its own
+            # sync-wide bound) don't keep other playlists from being fetched
+            async with sem:
+                sync_logger.info(f"Syncing playlist: {playlist_name}")
+
+                # Get current online playlist data
+                if source == 'youtube':
+                    online_data = await asyncio.to_thread(get_playlist_info, playlist_url)
+                    if not online_data or 'entries' not in online_data:
+                        sync_logger.warning(f"Could not fetch online data for {playlist_name}")
+                        return {'status': 'error'}
+                    online_songs_raw = online_data['entries']
+                    online_songs = [{'title': s.get('title', 'Unknown'), 'artist': 'YouTube', 'url': s.get('url'), 'source': 'youtube'} for s in online_songs_raw]
+                else: # spotify
+                    online_data = await self.api_client.get_playlist_details(playlist_url)
+                    if not online_data or 'songs' not in online_data:
+                        sync_logger.warning(f"Could not fetch online data for {playlist_name}")
+                        return {'status': 'error'}
+                    online_songs = online_data['songs']
+
+            saved_songs = playlist_data.get('songs', [])
+
+            # Find new songs by comparing URLs AND checking if files actually exist
+            playlist_dir = MUSIC_DIR / playlist_name
+            existing_files = await asyncio.to_thread(list_dir_files, playlist_dir)
+
+            # URL -> saved song, so only songs still in the online playlist get their
+            # filename rebuilt and checked instead of every saved song
+            saved_by_url = {}
+            for song in saved_songs:
+                if song.get('url'):
+                    saved_by_url.setdefault(song['url'], song)
+
+            # URL -> online song; a track listed twice online is only downloaded once
+            online_by_url = {}
+            for song in online_songs:
+                if song.get('url'):
+                    online_by_url.setdefault(song['url'], song)
+
+            new_songs = []
+            for song_url, song in online_by_url.items():
+                saved_song = saved_by_url.get(song_url)
+                if saved_song is None:
+                    new_songs.append(song)
+                    continue
+
+                # Only consider songs as "saved" if they exist both in JSON AND on disk
+                if song_filename(saved_song, source) not in existing_files:
+                    sync_logger.info(f"File missing for '{saved_song.get('title', 'Unknown')}' - will be re-downloaded")
+                    new_songs.append(song)
+
+            if not new_songs:
+                sync_logger.info(f"No new songs found in {playlist_name}")
+                return {'status': 'synced', 'playlist_id': playlist_id, 'new_songs_count': 0,
+                        'playlist_info': None, 'downloaded': []}
+
+            sync_logger.info(f"Found {len(new_songs)} new songs in {playlist_name}")
+
+            # Store detailed information about this playlist
+            playlist_info = {
+                'id': playlist_id,
+                'name': playlist_name,
+                'new_songs_count': len(new_songs),
+                'new_songs': new_songs[:3]  # Store first 3 songs for preview
+            }
+
+            # Download new songs; only successful ones are added to the database
+            successfully_downloaded = []
+            if auto_download:
+                successfully_downloaded = await self._download_new_songs(new_songs, playlist_data, playlist_id, download_sem)
+                sync_logger.info(f"Auto-downloaded and saved {len(successfully_downloaded)}/{len(new_songs)} new songs")
+                new_songs_count = len(successfully_downloaded)
+            else:
+                # If auto-download is disabled, don't add new songs to database
+                # They'll be detected again on next sync or manual download
+                sync_logger.info(f"Auto-download disabled, {len(new_songs)} new songs not downloaded")
+                new_songs_count = len(new_songs)  # Still count them as "found"
+
+            # sync_all_playlists adds the downloaded songs to the DB in its single final write
+            return {'status': 'synced', 'playlist_id': playlist_id, 'new_songs_count': new_songs_count,
+                    'playlist_info': playlist_info, 'downloaded': successfully_downloaded}
+
+        except Exception as e:
+            sync_logger.error(f"Error syncing {playlist_name}: {e}")
+            return {'status': 'error'}
+
+    async def _download_new_songs(self, new_songs: List[Dict], playlist_data: Dict, playlist_id: str,
+                                  sem: asyncio.Semaphore = None):
+        """Download newly found songs and return only successfully downloaded ones
+
+        `sem` bounds downloads across calls (a sync shares one between all playlists);
+        without it, this call gets its own MAX_DOWNLOAD_CONCURRENCY bound.
+        """
         playlist_name = playlist_data.get('name', 'Unknown')
         playlist_dir = MUSIC_DIR / playlist_name
-        playlist_dir.mkdir(exist_ok=True)
         source = playlist_data.get('source', 'spotify')
 
         download_logger.info(f"Auto-downloading {len(new_songs)} new songs for {playlist_name}")
-        successfully_downloaded_songs = []
 
-        for song in new_songs:
-            try:
-                if source == 'youtube':
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    file_path = playlist_dir / f"{song_title}.mp3"
-                else:
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-                    file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
+        if sem is None:
+            sem = asyncio.Semaphore(MAX_DOWNLOAD_CONCURRENCY)
 
-                if file_path.exists():
-                    successfully_downloaded_songs.append(song)  # Already exists, count as success
-                    continue
+        def _prepare_dir():
+            playlist_dir.mkdir(exist_ok=True)
+            return list_dir_files(playlist_dir)
 
-                if source == 'youtube':
-                    success = download_audio_ytdlp(song['url'], str(file_path.with_suffix('')))
-                else:
-                    success = await self.api_client.download_song(song, file_path)
+        # Several playlists can be auto-downloading at once during a sync, so keep the
+        # folder setup and listing off the event loop too
+        existing_files = await asyncio.to_thread(_prepare_dir)
+
+        async def _dl(song):
+            """Download one song and report whether it ended up on disk"""
+            try:
+                file_name = song_filename(song, source)
+                if file_name in existing_files:
+                    return song, True  # Already exists, count as success
+
+                file_path = playlist_dir / file_name
+                async with sem:
+                    if source == 'youtube':
+                        success = await asyncio.to_thread(download_audio_ytdlp, song['url'], str(file_path.with_suffix('')))
+                    else:
+                        success = await self.api_client.download_song(song, file_path)
 
                 if success:
                     download_logger.info(f"Auto-downloaded: {song.get('artist', 'YouTube')} - {song.get('title', 'Unknown')}")
-                    successfully_downloaded_songs.append(song)  # Only add if successful
                 else:
                     download_logger.warning(f"Failed to auto-download: {song.get('artist', 'YouTube')} - {song.get('title', 'Unknown')}")
-                    # Don't add to successfully_downloaded_songs
+                return song, success
 
             except Exception as e:
                 download_logger.error(f"Error auto-downloading {song.get('title', 'Unknown')}: {e}")
-                # Don't add to successfully_downloaded_songs
+                return song, False
+
+        results = await asyncio.gather(*[_dl(song) for song in new_songs])
 
-        return successfully_downloaded_songs
+        # Only return songs that were downloaded successfully, in playlist order
+        return [song for song, success in results if success]
 
 sync_manager = None  # Will be initialized in main()
 proxy_manager = ProxyManager()  # Global proxy manager
 
 # --- ENHANCED API CLASS WITH RETRY AND PROXY SUPPORT ---
+# Statuses that won't change on retry (bad or unknown track URL)
+PERMANENT_HTTP_ERRORS = {400, 404, 410}
+
+class PermanentDownloadError(Exception):
+    """The download API rejected the request in a way retrying can't fix"""
+
 class SpotDownAPI:
     BASE_URL = "https://spotdown.app"
     # Only use real, verified backup services if/when they exist
@@ -951,23 +1464,216 @@ class SpotDownAPI:
     ]
     COMMON_HEADERS = { "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36" }
     BROWSER_LAUNCH_OPTIONS = { "headless": True, "timeout": 60000 }
+    # Headers for the shared spotdown.app browser context and its API calls
+    BROWSER_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+        "Accept-Language": "en-GB,en;q=0.9",
+        "Sec-Ch-Ua": '"Not=A?Brand";v="24", "Chromium";v="140"',
+        "Sec-Ch-Ua-Platform": '"Windows"',
+        "Sec-Ch-Ua-Mobile": "?0",
+    }
+    SONG_BROWSER_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:142.0) Gecko/20100101 Firefox/142.0",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Sec-Fetch-Site": "same-origin",
+        "Sec-Fetch-Mode": "cors",
+        "DNT": "1",
+        "Sec-GPC": "1",
+    }
+    # Headers for the direct /api/download POST, matching what the browser sends
+    DOWNLOAD_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:142.0) Gecko/20100101 Firefox/142.0",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Content-Type": "application/json",
+        "Origin": "https://spotdown.org",
+        "Referer": "https://spotdown.org/track",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-origin",
+        "DNT": "1",
+        "Sec-GPC": "1",
+        "Priority": "u=1, i"
+    }
+    # HTTP fallback headers; Origin/Referer are added per call from the domain being tried
+    FALLBACK_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/json, text/plain, */*',
+        'Content-Type': 'application/json',
+    }
+    API_HEADERS = {
+        "Accept": "application/json, text/plain, */*",
+        "Referer": "https://spotdown.app/playlist",
+        "Sec-Fetch-Site": "same-origin",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Dest": "empty"
+    }
 
     def __init__(self):
         self.proxy_manager = proxy_manager
-        self.current_base_url = self.BASE_URL
         self.failed_requests = 0
-        self.last_reset_time = datetime.now()
-        self.last_request_time = None
-        self.min_request_interval = 1.0  # Minimum seconds between requests
+        self.last_reset_time = monotonic()
+        self.min_request_interval = 1.0  # Sustained gap between requests (token refill interval)
+        self._next_token_time = 0.0  # Token bucket state, see _rate_limit
+
+        # Long-lived Playwright browser, started lazily and shared by all requests
+        self._pw = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._http: Optional[aiohttp.ClientSession] = None
+
+        # spotdown.app context whose session cookies are reused across playlist lookups
+        self._session_context = None
+        self._session_lock = asyncio.Lock()
+
+        # Spotify web-player tokens captured by _get_spotify_tokens, see _cached_spotify_tokens
+        self._spotify_tokens = None
+        self._spotify_tokens_expire = 0.0
+        self._spotify_tokens_lock = asyncio.Lock()
+
+    async def _ensure_browser(self):
+        """Start Playwright and Chromium once and reuse them across requests"""
+        if self._browser and self._browser.is_connected():
+            return self._browser
+
+        async with self._browser_lock:
+            if self._browser and self._browser.is_connected():
+                return self._browser
+
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
+            download_logger.info("Started shared Playwright browser")
+            return self._browser
+
+    @contextlib.asynccontextmanager
+    async def _browser_context(self, **context_options):
+        """Fresh, isolated context on the shared browser
+
+        Opening a context costs milliseconds where launching Chromium costs seconds;
+        only the context is closed on exit, the browser stays up for the next caller.
+        """
+        browser = await self._ensure_browser()
+        context = await browser.new_context(**context_options)
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                download_logger.debug(f"Error closing browser context: {e}")
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Shared, lazily created HTTP session so connections and DNS lookups are pooled
+
+        Nearly all traffic goes to one spotdown host, so idle connections are kept for
+        a minute (aiohttp's default is 15s) to survive the pauses between button clicks.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=MAX_DOWNLOAD_CONCURRENCY * 2,  # Enough for parallel downloads plus lookups
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                cookie_jar=aiohttp.DummyCookieJar()  # Keep calls independent, like the old per-call sessions
+            )
+        return self._http
+
+    async def _ensure_session_context(self):
+        """Return a browser context that has already visited spotdown.app
+
+        The page visit (plus the wait for its JS) only happens when the context
+        is first created, so later playlist lookups go straight to the API.
+        """
+        browser = await self._ensure_browser()
+        if self._session_context and self._session_context.browser is browser:
+            return self._session_context
+
+        async with self._session_lock:
+            if self._session_context and self._session_context.browser is browser:
+                return self._session_context
+
+            context = await browser.new_context(extra_http_headers=self.BROWSER_HEADERS)
+            try:
+                page = await context.new_page()
+                # Visit the main page once to establish the session
+                await page.goto(f"{self.BASE_URL}/playlist", wait_until="domcontentloaded", timeout=30000)
+                # Wait a moment for JS to load
+                await page.wait_for_timeout(1000)
+                await page.close()
+            except Exception:
+                await context.close()
+                raise
+
+            self._session_context = context
+            return context
+
+    async def _reset_session_context(self, stale=None):
+        """Drop the shared spotdown.app context so the next lookup starts a fresh session
+
+        Pass the context a failed request used; if another task already replaced
+        it, the new one is kept.
+        """
+        if stale is not None and self._session_context is not stale:
+            return
+        context, self._session_context = self._session_context, None
+        if context:
+            try:
+                await context.close()
+            except Exception as e:
+                download_logger.debug(f"Error closing session context: {e}")
+
+    async def _get_json_direct(self, api_url: str, referer: str):
+        """GET a spotdown.app JSON endpoint over the shared HTTP session, without a browser
+
+        Returns the parsed JSON, or None when the server wants a real browser
+        session (non-200 or non-JSON answer) so callers can fall back to Playwright.
+        """
+        headers = {**self.API_HEADERS, "User-Agent": self.BROWSER_HEADERS["User-Agent"], "Referer": referer}
+        try:
+            session = await self._get_http()
+            async with session.get(api_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 200 and 'json' in response.headers.get('content-type', '').lower():
+                    return await response.json(loads=_json_loads)
+                download_logger.debug(f"Direct API request not usable (Status: {response.status}), falling back to browser")
+        except Exception as e:
+            download_logger.debug(f"Direct API request failed, falling back to browser: {e}")
+        return None
+
+    async def aclose(self):
+        """Shut down the shared Playwright browser and HTTP session"""
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+        await self._reset_session_context()
+
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                download_logger.debug(f"Error closing shared browser: {e}")
+            self._browser = None
+
+        if self._pw:
+            try:
+                await self._pw.stop()
+            except Exception as e:
+                download_logger.debug(f"Error stopping Playwright: {e}")
+            self._pw = None
 
     async def _handle_api_failure(self):
         """Handle API failures by adjusting retry strategy"""
         self.failed_requests += 1
 
         # Reset counter every hour to give the service a fresh chance
-        if (datetime.now() - self.last_reset_time).total_seconds() > 3600:
+        if monotonic() - self.last_reset_time > 3600:
             self.failed_requests = 0
-            self.last_reset_time = datetime.now()
+            self.min_request_interval = 1.0
+            self.last_reset_time = monotonic()
             download_logger.info("Resetting failure counter - giving the service a fresh chance")
 
         # Log failure count for monitoring
@@ -976,7 +1682,7 @@ class SpotDownAPI:
 
         # Increase minimum request interval to avoid overwhelming the server
         if self.failed_requests > 10:
-            self.min_request_interval = min(3.0, 1.0 + (self.failed_requests * 0.1))
+            self.min_request_interval = max(self.min_request_interval, min(3.0, 1.0 + (self.failed_requests * 0.1)))
             download_logger.info(f"Increased request interval to {self.min_request_interval}s due to failures")
 
     def _should_use_proxy_immediately(self) -> bool:
@@ -984,47 +1690,64 @@ class SpotDownAPI:
         return self.failed_requests > 5  # Use proxy immediately after many failures
 
     async def _rate_limit(self):
-        """Implement rate limiting to avoid overwhelming the server"""
-        if self.last_request_time:
-            elapsed = (datetime.now() - self.last_request_time).total_seconds()
-            if elapsed < self.min_request_interval:
-                sleep_time = self.min_request_interval - elapsed
-                await asyncio.sleep(sleep_time)
-
-        self.last_request_time = datetime.now()
+        """Token bucket so concurrent downloads don't overwhelm the server
 
-    async def _try_http_fallback(self, song_url: str, download_path: Path) -> bool:
-        """Fallback HTTP method when browser fails"""
+        Up to MAX_DOWNLOAD_CONCURRENCY requests may start at once; after that one token
+        refills every `min_request_interval` seconds. Each caller reserves its slot
+        before sleeping, so concurrent workers queue up instead of racing.
+        """
+        now = monotonic()
+        interval = self.min_request_interval
+        slot = max(self._next_token_time, now)
+        self._next_token_time = slot + interval
+        wait = slot - (MAX_DOWNLOAD_CONCURRENCY - 1) * interval - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _slow_down(self):
+        """Halve the request rate after the server answers 429 Too Many Requests"""
+        self.min_request_interval = min(10.0, self.min_request_interval * 2)
+        download_logger.info(f"Rate limited by server, request interval now {self.min_request_interval}s")
+
+    async def _try_http_fallback(self, song_url: str, download_path: Path, base_domain: Optional[str] = None) -> bool:
+        """Fallback HTTP method when browser fails
+
+        `base_domain` is the spotdown mirror to use (BASE_URL by default). It is passed
+        per call, not kept on the shared instance, since downloads run concurrently.
+        """
+        base_domain = base_domain or self.BASE_URL
         try:
-            import aiohttp
-
             timeout = aiohttp.ClientTimeout(total=60)
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/plain, */*',
-                'Content-Type': 'application/json',
-                'Origin': self.current_base_url,
-                'Referer': f'{self.current_base_url}/playlist'
+                **self.FALLBACK_HEADERS,
+                'Origin': base_domain,
+                'Referer': f'{base_domain}/playlist'
             }
 
             # Try direct HTTP request
-            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-                api_url = f"{self.current_base_url}/api/download"
-                payload = {"url": song_url}
+            session = await self._get_http()
+            api_url = f"{base_domain}/api/download"
+            payload = {"url": song_url}
 
-                async with session.post(api_url, json=payload, ssl=False) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        if len(content) > 1000:
-                            content_type = response.headers.get('content-type', '').lower()
-                            if 'audio' in content_type or 'octet-stream' in content_type or len(content) > 100000:
-                                with open(download_path, 'wb') as f:
-                                    f.write(content)
-                                download_logger.info(f"HTTP fallback successful (Size: {len(content)} bytes)")
-                                return True
-
-                    download_logger.warning(f"HTTP fallback failed (Status: {response.status})")
-                    return False
+            async with session.post(api_url, json=payload, ssl=False, headers=headers, timeout=timeout) as response:
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '').lower()
+                    looks_like_audio = 'audio' in content_type or 'octet-stream' in content_type
+
+                    # Stream to a partial file so the whole song is never held in memory
+                    part_path = download_path.with_name(download_path.name + '.part')
+                    try:
+                        _, total = await stream_to_file(response, part_path)
+
+                        if total > 1000 and (looks_like_audio or total > 100000):
+                            await asyncio.to_thread(os.replace, part_path, download_path)
+                            download_logger.info(f"HTTP fallback successful (Size: {total} bytes)")
+                            return True
+                    finally:
+                        await asyncio.to_thread(part_path.unlink, missing_ok=True)
+
+                download_logger.warning(f"HTTP fallback failed (Status: {response.status})")
+                return False
 
         except Exception as e:
             download_logger.warning(f"HTTP fallback method failed: {e}")
@@ -1039,14 +1762,8 @@ class SpotDownAPI:
         api_url = f"{self.BASE_URL}/api/song-details?url={quote(track_url)}"
 
         try:
-            async with async_playwright() as p:
-                try:
-                    browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-                except Exception as e:
-                    download_logger.error(f"Failed to start Playwright: {e}")
-                    return None
-
-                page = await browser.new_page()
+            async with self._browser_context() as context:
+                page = await context.new_page()
                 await page.set_extra_http_headers(self.COMMON_HEADERS)
 
                 try:
@@ -1056,7 +1773,6 @@ class SpotDownAPI:
                         content = await page.content()
                         if "songs" in content:
                             json_data = await response.json()
-                            await browser.close()
 
                             # For single tracks, we expect just one song in the response
                             if json_data and "songs" in json_data and len(json_data["songs"]) > 0:
@@ -1085,11 +1801,9 @@ class SpotDownAPI:
                                 }
 
                     download_logger.warning(f"❌ No song data found in API response for: {track_url}")
-                    await browser.close()
                     return None
 
                 except Exception as e:
-                    await browser.close()
                     download_logger.error(f"Error getting track details: {e}")
                     return None
 
@@ -1109,14 +1823,12 @@ class SpotDownAPI:
 
             # If we don't have tokens, get them first
             if not tokens:
-                tokens = await self._get_spotify_tokens()
+                tokens = await self._cached_spotify_tokens()
 
             if not tokens or not tokens.get('auth_token'):
                 download_logger.warning("No tokens available for advanced track details")
                 return await self.get_track_details(track_url)
 
-            import aiohttp
-
             # GraphQL query for track details
             payload = {
                 "variables": {
@@ -1146,18 +1858,21 @@ class SpotDownAPI:
             }
 
             timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    'https://api-partner.spotify.com/pathfinder/v2/query',
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._extract_track_details_from_response(data, track_url)
-                    else:
-                        download_logger.warning(f"Advanced track details failed with status: {response.status}")
-                        return await self.get_track_details(track_url)
+            session = await self._get_http()
+            async with session.post(
+                'https://api-partner.spotify.com/pathfinder/v2/query',
+                json=payload,
+                headers=headers,
+                timeout=timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json_loads)
+                    return self._extract_track_details_from_response(data, track_url)
+                else:
+                    download_logger.warning(f"Advanced track details failed with status: {response.status}")
+                    if response.status == 401:
+                        self._spotify_tokens = None  # Expired early; capture fresh ones next time
+                    return await self.get_track_details(track_url)
 
         except Exception as e:
             download_logger.error(f"Error getting advanced track details: {e}")
@@ -1221,40 +1936,61 @@ class SpotDownAPI:
             'download_url': ''
         }
 
+    async def _cached_spotify_tokens(self):
+        """Spotify tokens, captured once and reused until shortly before they expire
+
+        Capturing them drives a browser through open.spotify.com for several seconds,
+        so concurrent callers wait on a single capture instead of each running one.
+        The lifetime is jittered so bots started together don't all refresh at once.
+        """
+        if self._spotify_tokens and monotonic() < self._spotify_tokens_expire:
+            return self._spotify_tokens
+
+        async with self._spotify_tokens_lock:
+            if self._spotify_tokens and monotonic() < self._spotify_tokens_expire:
+                return self._spotify_tokens
+
+            tokens = await self._get_spotify_tokens()
+            if tokens and tokens.get('auth_token'):
+                self._spotify_tokens = tokens
+                self._spotify_tokens_expire = monotonic() + SPOTIFY_TOKEN_TTL_SECONDS * random.uniform(0.9, 1.0)
+            return tokens
+
     async def _get_spotify_tokens(self):
         """Get Spotify tokens by visiting the site"""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-                page = await browser.new_page()
+            async with self._browser_context() as context:
+                page = await context.new_page()
 
                 captured_tokens = {}
                 requests_seen = []
+                tokens_ready = asyncio.Event()  # Set once both tokens have been captured
 
-                # Simple request interceptor that doesn't block
+                # Simple request interceptor that doesn't block. Only routed for the two API
+                # hosts that carry the tokens, so page assets never round-trip through Python
                 async def simple_intercept(route):
                     try:
                         request = route.request
                         url = request.url
                         headers = request.headers
 
-                        # Log important requests
-                        if any(endpoint in url for endpoint in ['spotify.com', 'clienttoken.spotify.com']):
-                            requests_seen.append(url)
-                            download_logger.info(f"🔍 Intercepted: {url}")
+                        requests_seen.append(url)
+                        download_logger.info(f"🔍 Intercepted: {url}")
+
+                        # Capture tokens from request headers (non-blocking)
+                        auth_header = headers.get('authorization', '')
+                        client_header = headers.get('client-token', '')
 
-                            # Capture tokens from request headers (non-blocking)
-                            if any(endpoint in url for endpoint in ['api-partner.spotify.com', 'spclient.wg.spotify.com']):
-                                auth_header = headers.get('authorization', '')
-                                client_header = headers.get('client-token', '')
+                        if auth_header and 'Bearer' in auth_header:
+                            captured_tokens['auth_token'] = auth_header.replace('Bearer ', '')
+                            download_logger.info(f"🎯 Got auth token from headers!")
 
-                                if auth_header and 'Bearer' in auth_header:
-                                    captured_tokens['auth_token'] = auth_header.replace('Bearer ', '')
-                                    download_logger.info(f"🎯 Got auth token from headers!")
+                        if client_header:
+                            captured_tokens['client_token'] = client_header
+                            download_logger.info(f"🎯 Got client token from headers!")
 
-                                if client_header:
-                                    captured_tokens['client_token'] = client_header
-                                    download_logger.info(f"🎯 Got client token from headers!")
+                        if captured_tokens.get('auth_token') and captured_tokens.get('client_token'):
+                            tokens_ready.set()
 
                         # Continue request without blocking
                         await route.continue_()
@@ -1266,15 +2002,24 @@ class SpotDownAPI:
                         except:
                             pass
 
-                await page.route("**/*", simple_intercept)
+                async def wait_for_tokens(timeout_ms):
+                    """Wait up to timeout_ms, returning as soon as both tokens are captured"""
+                    try:
+                        await asyncio.wait_for(tokens_ready.wait(), timeout_ms / 1000)
+                    except asyncio.TimeoutError:
+                        pass
+
+                await page.route("**/api-partner.spotify.com/**", simple_intercept)
+                await page.route("**/spclient.wg.spotify.com/**", simple_intercept)
+                # Tokens come from the page's JS; images, media and fonts only slow the load down
+                await page.route("**/*.{png,jpg,jpeg,webp,gif,svg,ico,mp4,woff,woff2}", lambda route: route.abort())
 
                 # Visit Spotify main page
                 download_logger.info("Playwright: Visiting Spotify main page")
                 await page.goto('https://open.spotify.com/', wait_until='domcontentloaded', timeout=15000)
-                await page.wait_for_timeout(1000)
 
                 # Wait for initial load and check for tokens already captured
-                await page.wait_for_timeout(2000)
+                await wait_for_tokens(3000)
                 download_logger.info(f"After initial load - tokens captured: auth={bool(captured_tokens.get('auth_token'))}, client={bool(captured_tokens.get('client_token'))}")
 
                 # If we don't have tokens yet, try to trigger API calls with navigation
@@ -1283,7 +2028,7 @@ class SpotDownAPI:
                         download_logger.info("Playwright: Navigating to search to trigger API calls")
                         # Direct navigation to search page to trigger token generation
                         await page.goto('https://open.spotify.com/search/eminem', timeout=15000)
-                        await page.wait_for_timeout(3000)
+                        await wait_for_tokens(3000)
 
                         download_logger.info(f"After search navigation - tokens captured: auth={bool(captured_tokens.get('auth_token'))}, client={bool(captured_tokens.get('client_token'))}")
 
@@ -1295,7 +2040,7 @@ class SpotDownAPI:
                     try:
                         download_logger.info("Playwright: Trying to trigger token generation with page reload")
                         await page.reload(timeout=10000)
-                        await page.wait_for_timeout(2000)
+                        await wait_for_tokens(2000)
 
                     except Exception as e:
                         download_logger.warning(f"Page reload failed: {e}")
@@ -1357,7 +2102,6 @@ class SpotDownAPI:
                 download_logger.info(f"Playwright: Captured tokens: {bool(captured_tokens.get('auth_token'))}, {bool(captured_tokens.get('client_token'))}")
                 download_logger.info(f"Playwright: Requests seen: {len(requests_seen)}")
 
-                await browser.close()
                 return captured_tokens
 
         except Exception as e:
@@ -1381,7 +2125,6 @@ class SpotDownAPI:
 
     async def _get_public_spotify_tokens(self):
         """Get public Spotify tokens with proper browser simulation"""
-        import aiohttp
         import random
         import time
         import json
@@ -1392,7 +2135,11 @@ class SpotDownAPI:
 
             # Create session with cookie jar - no cookies set initially
             jar = aiohttp.CookieJar()
-            async with aiohttp.ClientSession(timeout=timeout, cookie_jar=jar) as session:
+            # Borrow the shared connection pool (connector_owner=False leaves it open) so
+            # repeat token fetches reuse TLS connections; the cookies stay in this session's jar
+            shared_http = await self._get_http()
+            async with aiohttp.ClientSession(timeout=timeout, cookie_jar=jar, connector=shared_http.connector,
+                                             connector_owner=False) as session:
 
                 # Step 1: Visit main page exactly as browser does
                 main_headers = {
@@ -1508,8 +2255,10 @@ class SpotDownAPI:
 
                     if response.status == 200:
                         try:
-                            client_data = await response.json()
-                            download_logger.info(f"Client token response: {json.dumps(client_data, indent=2)}")
+                            client_data = await response.json(loads=_json_loads)
+                            # Pretty-printing the payload is only worth it when debugging (it also holds the token)
+                            if download_logger.isEnabledFor(logging.DEBUG):
+                                download_logger.debug(f"Client token response: {json.dumps(client_data, indent=2)}")
 
                             client_token = client_data.get('granted_token', {}).get('token')
 
@@ -1565,8 +2314,9 @@ class SpotDownAPI:
 
                                 if token_response.status == 200:
                                     try:
-                                        token_data = await token_response.json()
-                                        download_logger.info(f"Token API response: {json.dumps(token_data, indent=2)}")
+                                        token_data = await token_response.json(loads=_json_loads)
+                                        if download_logger.isEnabledFor(logging.DEBUG):
+                                            download_logger.debug(f"Token API response: {json.dumps(token_data, indent=2)}")
 
                                         auth_token = token_data.get('accessToken')
                                         if auth_token:
@@ -1615,11 +2365,9 @@ class SpotDownAPI:
 
     async def _direct_spotify_api_search(self, query: str, limit: int):
         """Direct API call to Spotify using public tokens"""
-        import aiohttp
-
         # Try Playwright method first (most reliable)
         try:
-            tokens = await self._get_spotify_tokens()
+            tokens = await self._cached_spotify_tokens()
             if tokens and tokens.get('auth_token') and tokens.get('client_token'):
                 auth_token = tokens['auth_token']
                 client_token = tokens['client_token']
@@ -1684,56 +2432,59 @@ class SpotDownAPI:
         }
 
         timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                'https://api-partner.spotify.com/pathfinder/v2/query',
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._extract_tracks_from_spotify_response(data, limit)
+        session = await self._get_http()
+        async with session.post(
+            'https://api-partner.spotify.com/pathfinder/v2/query',
+            json=payload,
+            headers=headers,
+            timeout=timeout
+        ) as response:
+            if response.status == 200:
+                data = await response.json(loads=_json_loads)
+                return self._extract_tracks_from_spotify_response(data, limit)
+            else:
+                download_logger.error(f"Spotify API call failed with status: {response.status}")
+                response_text = await response.text()
+                download_logger.error(f"Response: {response_text}")
+                if response.status == 401:
+                    self._spotify_tokens = None  # Expired early; capture fresh ones next time
+                    raise Exception("Spotify API tokens expired - using fallback search")
                 else:
-                    download_logger.error(f"Spotify API call failed with status: {response.status}")
-                    response_text = await response.text()
-                    download_logger.error(f"Response: {response_text}")
-                    if response.status == 401:
-                        raise Exception("Spotify API tokens expired - using fallback search")
-                    else:
-                        raise Exception(f"API call failed with status {response.status}")
+                    raise Exception(f"API call failed with status {response.status}")
 
     def _extract_tracks_from_spotify_response(self, data: dict, limit: int):
         """Extract track information from Spotify API response"""
         tracks = []
 
         try:
-            # Log the full response structure for debugging
-            download_logger.debug(f"Full API response keys: {list(data.keys())}")
-            if 'data' in data:
-                download_logger.debug(f"Data section keys: {list(data['data'].keys())}")
-                if 'searchV2' in data['data']:
-                    search_data = data['data']['searchV2']
-                    download_logger.debug(f"SearchV2 section keys: {list(search_data.keys())}")
-
-                    # Log sample of each section for debugging
-                    for section_name in search_data.keys():
-                        section = search_data[section_name]
-                        if isinstance(section, dict) and 'items' in section:
-                            items = section['items']
-                            download_logger.debug(f"{section_name} has {len(items)} items")
-                            if items:
-                                download_logger.debug(f"First item in {section_name}: {items[0].keys() if isinstance(items[0], dict) else type(items[0])}")
+            # Log the full response structure for debugging (walks every section, so
+            # only when debug logging is actually on)
+            if download_logger.isEnabledFor(logging.DEBUG):
+                download_logger.debug(f"Full API response keys: {list(data.keys())}")
+                if 'data' in data:
+                    download_logger.debug(f"Data section keys: {list(data['data'].keys())}")
+                    if 'searchV2' in data['data']:
+                        search_data = data['data']['searchV2']
+                        download_logger.debug(f"SearchV2 section keys: {list(search_data.keys())}")
+
+                        # Log sample of each section for debugging
+                        for section_name in search_data.keys():
+                            section = search_data[section_name]
+                            if isinstance(section, dict) and 'items' in section:
+                                items = section['items']
+                                download_logger.debug(f"{section_name} has {len(items)} items")
+                                if items:
+                                    download_logger.debug(f"First item in {section_name}: {items[0].keys() if isinstance(items[0], dict) else type(items[0])}")
+                    else:
+                        download_logger.debug("No searchV2 section found in data")
                 else:
-                    download_logger.debug("No searchV2 section found in data")
-            else:
-                download_logger.debug("No data section found in response")
+                    download_logger.debug("No data section found in response")
 
             # Navigate to the search data
             search_data = data.get('data', {}).get('searchV2', {})
 
             # Log what sections we have available for debugging
-            available_sections = list(search_data.keys())
-            download_logger.debug(f"Available search sections: {available_sections}")
+            download_logger.debug(f"Available search sections: {list(search_data)}")
 
             # Try multiple approaches to find tracks
 
@@ -1943,85 +2694,77 @@ class SpotDownAPI:
 
     async def _simple_spotify_search(self, query: str, limit: int):
         """Simplified Spotify search using direct browser automation"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-            context = await browser.new_context()
+        async with self._browser_context() as context:
             page = await context.new_page()
 
-            try:
-                # Set realistic headers
-                await page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-User': '?1',
-                    'Sec-Fetch-Dest': 'document'
-                })
+            # Set realistic headers
+            await page.set_extra_http_headers({
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'Sec-Fetch-Site': 'none',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-User': '?1',
+                'Sec-Fetch-Dest': 'document'
+            })
 
-                # Navigate to Spotify search page
-                search_url = f"https://open.spotify.com/search/{quote(query)}"
-                await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            # Navigate to Spotify search page
+            search_url = f"https://open.spotify.com/search/{quote(query)}"
+            await page.goto(search_url, wait_until='networkidle', timeout=30000)
 
-                # Wait for the page to load completely
-                await page.wait_for_timeout(5000)
+            # Wait for the page to load completely
+            await page.wait_for_timeout(5000)
 
-                # Try to trigger search by clicking tracks if available
+            # Try to trigger search by clicking tracks if available
+            try:
+                await page.click('[data-testid="search-tracks-nav-item"]', timeout=3000)
+                await page.wait_for_timeout(2000)
+            except:
+                # If tracks tab doesn't exist, try other selectors
                 try:
-                    await page.click('[data-testid="search-tracks-nav-item"]', timeout=3000)
+                    await page.click('button[role="tab"]:has-text("Songs")', timeout=2000)
                     await page.wait_for_timeout(2000)
                 except:
-                    # If tracks tab doesn't exist, try other selectors
-                    try:
-                        await page.click('button[role="tab"]:has-text("Songs")', timeout=2000)
-                        await page.wait_for_timeout(2000)
-                    except:
-                        pass
-
-                # Extract track information from the page
-                tracks = []
+                    pass
 
-                # Multiple selectors to try for track elements
-                selectors_to_try = [
-                    '[data-testid="tracklist-row"]',
-                    '[data-testid="track-item"]',
-                    'div[role="row"]',
-                    '.track-item',
-                    'article[data-testid]'
-                ]
+            # Extract track information from the page
+            tracks = []
 
-                track_elements = []
-                for selector in selectors_to_try:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        if elements:
-                            track_elements = elements
-                            break
-                    except:
-                        continue
+            # Multiple selectors to try for track elements
+            selectors_to_try = [
+                '[data-testid="tracklist-row"]',
+                '[data-testid="track-item"]',
+                'div[role="row"]',
+                '.track-item',
+                'article[data-testid]'
+            ]
 
-                # If no specific track elements found, try to find links to tracks
-                if not track_elements:
-                    track_elements = await page.query_selector_all('a[href*="/track/"]')
+            track_elements = []
+            for selector in selectors_to_try:
+                try:
+                    elements = await page.query_selector_all(selector)
+                    if elements:
+                        track_elements = elements
+                        break
+                except:
+                    continue
 
-                for element in track_elements[:limit]:
-                    try:
-                        # Try different methods to extract track info
-                        track_info = await self._extract_track_from_element(page, element)
-                        if track_info:
-                            tracks.append(track_info)
+            # If no specific track elements found, try to find links to tracks
+            if not track_elements:
+                track_elements = await page.query_selector_all('a[href*="/track/"]')
 
-                    except Exception as e:
-                        download_logger.debug(f"Error extracting track from element: {e}")
-                        continue
+            for element in track_elements[:limit]:
+                try:
+                    # Try different methods to extract track info
+                    track_info = await self._extract_track_from_element(page, element)
+                    if track_info:
+                        tracks.append(track_info)
 
-                await browser.close()
-                return tracks
+                except Exception as e:
+                    download_logger.debug(f"Error extracting track from element: {e}")
+                    continue
 
-            except Exception as e:
-                await browser.close()
-                raise e
+            return tracks
 
     async def _extract_track_from_element(self, page, element):
         """Extract track information from a DOM element"""
@@ -2112,8 +2855,6 @@ class SpotDownAPI:
     async def _make_spotify_search_api_call(self, query: str, limit: int, tokens: dict):
         """Make the actual GraphQL API call to search Spotify"""
         try:
-            import aiohttp
-
             # GraphQL query payload
             payload = {
                 "variables": {
@@ -2151,18 +2892,19 @@ class SpotDownAPI:
             }
 
             timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    'https://api-partner.spotify.com/pathfinder/v2/query',
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._extract_tracks_from_search_response(data, limit)
-                    else:
-                        download_logger.error(f"Spotify API search failed with status: {response.status}")
-                        return await self._fallback_search(query, limit)
+            session = await self._get_http()
+            async with session.post(
+                'https://api-partner.spotify.com/pathfinder/v2/query',
+                json=payload,
+                headers=headers,
+                timeout=timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json_loads)
+                    return self._extract_tracks_from_search_response(data, limit)
+                else:
+                    download_logger.error(f"Spotify API search failed with status: {response.status}")
+                    return await self._fallback_search(query, limit)
 
         except Exception as e:
             download_logger.error(f"Error making Spotify API call: {e}")
@@ -2237,9 +2979,8 @@ class SpotDownAPI:
     async def _fallback_search(self, query: str, limit: int):
         """Fallback search method using HTML parsing"""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-                page = await browser.new_page()
+            async with self._browser_context() as context:
+                page = await context.new_page()
                 await page.set_extra_http_headers(self.COMMON_HEADERS)
 
                 # Navigate to search page
@@ -2292,7 +3033,6 @@ class SpotDownAPI:
                 except Exception as e:
                     download_logger.error(f"Error in fallback search DOM parsing: {e}")
 
-                await browser.close()
                 return tracks
 
         except Exception as e:
@@ -2303,54 +3043,35 @@ class SpotDownAPI:
         # First try with spotdown.app
         api_url = f"{self.BASE_URL}/api/song-details?url={quote(playlist_url)}"
 
-        try:
-            async with async_playwright() as p:
-                try:
-                    browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-                except Exception as e:
-                    download_logger.error(f"Failed to start Playwright: {e}")
-                    return None
-
-                # Create browser context with proper headers
-                browser_headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-                    "Accept-Language": "en-GB,en;q=0.9",
-                    "Sec-Ch-Ua": '"Not=A?Brand";v="24", "Chromium";v="140"',
-                    "Sec-Ch-Ua-Platform": '"Windows"',
-                    "Sec-Ch-Ua-Mobile": "?0",
-                }
+        # A plain HTTP request is enough most of the time; only pay for the browser when it isn't
+        result = await self._get_json_direct(api_url, f"{self.BASE_URL}/playlist")
+        if result:
+            download_logger.info("✅ Successfully got playlist details from spotdown.app")
+            return result
 
-                context = await browser.new_context(extra_http_headers=browser_headers)
-                page = await context.new_page()
-                try:
-                    # First visit the main page to establish session
-                    await page.goto(f"{self.BASE_URL}/playlist", wait_until="domcontentloaded", timeout=30000)
-
-                    # Wait a moment for JS to load
-                    await page.wait_for_timeout(1000)
-
-                    # Make API request with proper headers
-                    headers = {
-                        "Accept": "application/json, text/plain, */*",
-                        "Referer": "https://spotdown.app/playlist",
-                        "Sec-Fetch-Site": "same-origin",
-                        "Sec-Fetch-Mode": "cors",
-                        "Sec-Fetch-Dest": "empty"
-                    }
+        try:
+            try:
+                context = await self._ensure_session_context()
+            except Exception as e:
+                download_logger.error(f"Failed to start Playwright session: {e}")
+                return None
 
-                    response = await page.request.get(api_url, headers=headers, timeout=30000)
-                    if response.ok:
-                        result = await response.json()
-                        download_logger.info("✅ Successfully got playlist details from spotdown.app")
-                        return result
-                    else:
-                        download_logger.warning(f"API request failed (Status: {response.status})")
-                        return None
-                except Exception as e:
-                    download_logger.error(f"Request exception: {e}")
+            try:
+                # The context shares its cookies with this request client
+                response = await context.request.get(api_url, headers=self.API_HEADERS, timeout=30000)
+                if response.ok:
+                    result = _json_loads(await response.body())
+                    download_logger.info("✅ Successfully got playlist details from spotdown.app")
+                    return result
+                else:
+                    download_logger.warning(f"API request failed (Status: {response.status})")
+                    # Session may have expired; re-establish it on the next call
+                    await self._reset_session_context(context)
                     return None
-                finally:
-                    await browser.close()
+            except Exception as e:
+                download_logger.error(f"Request exception: {e}")
+                await self._reset_session_context(context)
+                return None
         except Exception as e:
             download_logger.error(f"General request error: {e}")
 
@@ -2358,35 +3079,30 @@ class SpotDownAPI:
         return None
 
     async def get_song_details(self, song_url: str):
-        """Get song details using the proper API flow"""
-        # Use the same flow as playlist but for individual songs
-        api_url = f"{self.BASE_URL}/api/song-details?url={quote(song_url)}"
-
-        try:
-            async with async_playwright() as p:
-                try:
-                    browser = await p.chromium.launch(**self.BROWSER_LAUNCH_OPTIONS)
-                except Exception as e:
-                    download_logger.error(f"Failed to start Playwright for song details: {e}")
-                    return None
+        """Get song details using the proper API flow"""
+        # Use the same flow as playlist but for individual songs
+        api_url = f"{self.BASE_URL}/api/song-details?url={quote(song_url)}"
 
-                # Create browser context with proper headers
-                browser_headers = {
-                    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:142.0) Gecko/20100101 Firefox/142.0",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Sec-Fetch-Site": "same-origin",
-                    "Sec-Fetch-Mode": "cors",
-                    "DNT": "1",
-                    "Sec-GPC": "1",
-                }
+        result = await self._get_json_direct(api_url, f"{self.BASE_URL}/")
+        if result:
+            download_logger.info("✅ Successfully got song details from spotdown.app")
+            return result
 
-                context = await browser.new_context(
-                    extra_http_headers=browser_headers,
-                    ignore_https_errors=True
-                )
-                page = await context.new_page()
+        try:
+            try:
+                await self._ensure_browser()
+            except Exception as e:
+                download_logger.error(f"Failed to start Playwright for song details: {e}")
+                return None
 
+            # Fresh context per song on the shared browser; only the context is closed afterwards
+            async with self._browser_context(
+                extra_http_headers=self.SONG_BROWSER_HEADERS,
+                ignore_https_errors=True
+            ) as context:
                 try:
+                    page = await context.new_page()
+
                     # First visit the main page to establish session
                     await page.goto(f"{self.BASE_URL}/", wait_until="domcontentloaded", timeout=30000)
 
@@ -2394,17 +3110,11 @@ class SpotDownAPI:
                     await page.wait_for_timeout(2000)
 
                     # Make API request with proper headers matching browser
-                    headers = {
-                        "Accept": "application/json, text/plain, */*",
-                        "Referer": "https://spotdown.app/",
-                        "Sec-Fetch-Site": "same-origin",
-                        "Sec-Fetch-Mode": "cors",
-                        "Sec-Fetch-Dest": "empty"
-                    }
+                    headers = {**self.API_HEADERS, "Referer": "https://spotdown.app/"}
 
                     response = await page.request.get(api_url, headers=headers, timeout=30000)
                     if response.ok:
-                        result = await response.json()
+                        result = _json_loads(await response.body())
                         download_logger.info("✅ Successfully got song details from spotdown.app")
                         return result
                     else:
@@ -2414,14 +3124,13 @@ class SpotDownAPI:
                 except Exception as e:
                     download_logger.error(f"Song details request exception: {e}")
                     return None
-                finally:
-                    await browser.close()
 
         except Exception as e:
             download_logger.error(f"Failed to get song details: {e}")
             return None
 
-    async def _download_with_session(self, song_url: str, download_path: Path, song_title: str) -> bool:
+    async def _download_with_session(self, song_url: str, download_path: Path, song_title: str,
+                                     base_domain: Optional[str] = None) -> bool:
         """Download song using direct HTTP POST request (optimized approach)
         
         Flow based on actual SpotDown.app behavior:
@@ -2430,25 +3139,8 @@ class SpotDownAPI:
         3. Save directly to disk
         """
         try:
-            # Prepare headers exactly like browser does
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:142.0) Gecko/20100101 Firefox/142.0",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Content-Type": "application/json",
-                "Origin": "https://spotdown.org",
-                "Referer": "https://spotdown.org/track",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-                "DNT": "1",
-                "Sec-GPC": "1",
-                "Priority": "u=1, i"
-            }
-
             payload = {"url": song_url}
-            api_url = f"{self.current_base_url}/api/download"
+            api_url = f"{base_domain or self.BASE_URL}/api/download"
 
             download_logger.debug(f"🌐 Downloading from: {api_url}")
             download_logger.debug(f"📤 Payload: {payload}")
@@ -2462,41 +3154,47 @@ class SpotDownAPI:
                 if proxy:
                     download_logger.info(f"🔄 Using proxy: {proxy}")
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    api_url,
-                    json=payload,
-                    headers=headers,
-                    ssl=False,
-                    proxy=proxy
-                ) as response:
-                    # Check response status
-                    if response.status != 200:
-                        error_text = await response.text()
-                        download_logger.warning(f"❌ API returned status {response.status}")
-                        download_logger.debug(f"Response: {error_text[:500]}")
-                        return False
+            session = await self._get_http()
+            async with session.post(
+                api_url,
+                json=payload,
+                headers=self.DOWNLOAD_HEADERS,
+                ssl=False,
+                proxy=proxy,
+                timeout=timeout
+            ) as response:
+                # Check response status
+                if response.status != 200:
+                    error_text = await response.text()
+                    download_logger.warning(f"❌ API returned status {response.status}")
+                    download_logger.debug(f"Response: {error_text[:500]}")
+                    if response.status == 429:
+                        self._slow_down()
+                    if response.status in PERMANENT_HTTP_ERRORS:
+                        raise PermanentDownloadError(f"status {response.status}")
+                    return False
 
-                    # Read response content
-                    content = await response.read()
-                    content_type = response.headers.get('content-type', '').lower()
+                # Decide from the headers whether this is an error body or audio
+                content_type = response.headers.get('content-type', '').lower()
 
+                # Check for JSON error response (small, so it is read whole)
+                if 'application/json' in content_type:
+                    content = await response.read()
                     download_logger.debug(f"📥 Response size: {len(content)} bytes, Type: {content_type}")
+                    try:
+                        error_data = _json_loads(content)
+                        error_msg = error_data.get('message', error_data.get('error', 'Unknown error'))
+                        download_logger.warning(f"⚠️  API returned error: {error_msg}")
+                        return False
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        # Not JSON, might be audio data, continue
+                        return await self._validate_and_save_audio(content, content_type, download_path, song_title)
 
-                    # Check for JSON error response
-                    if 'application/json' in content_type:
-                        try:
-                            error_data = json.loads(content.decode('utf-8'))
-                            error_msg = error_data.get('message', error_data.get('error', 'Unknown error'))
-                            download_logger.warning(f"⚠️  API returned error: {error_msg}")
-                            return False
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            # Not JSON, might be audio data, continue
-                            pass
-
-                    # Validate audio content
-                    return await self._validate_and_save_audio(content, content_type, download_path, song_title)
+                # Validate and save the audio without buffering the whole song
+                return await self._stream_audio_to_file(response, content_type, download_path, song_title)
 
+        except PermanentDownloadError:
+            raise
         except aiohttp.ClientError as e:
             download_logger.warning(f"HTTP client error: {e}")
             return False
@@ -2508,75 +3206,71 @@ class SpotDownAPI:
             download_logger.debug(f"Exception type: {type(e).__name__}, Details: {str(e)}")
             return False
 
-    async def _validate_and_save_audio(self, content: bytes, content_type: str, download_path: Path, song_title: str) -> bool:
-        """Validate audio content and save to disk
-        
-        Validation checks:
+    def _check_audio(self, head: bytes, size: int, content_type: str) -> bool:
+        """Decide whether a response is worth keeping as audio
+
+        Only needs the first bytes and the total size, so streamed downloads can be
+        checked without holding the body. Validation checks:
         - Minimum size (MP3 files should be > 1KB)
         - Valid audio/mpeg content type OR
         - Starts with MP3 frame marker (ID3 or 0xFF)
         - Size > 100KB (typical MP3 requirements)
         """
-        try:
-            # Check minimum size
-            if len(content) < 1000:
-                download_logger.warning(f"⚠️  Response too small ({len(content)} bytes) - likely not an audio file")
-                try:
-                    text_content = content.decode('utf-8', errors='ignore')[:200]
-                    if text_content:
-                        download_logger.debug(f"Response content: {text_content}")
-                except:
-                    pass
+        # Check minimum size
+        if size < 1000:
+            download_logger.warning(f"⚠️  Response too small ({size} bytes) - likely not an audio file")
+            text_content = head.decode('utf-8', errors='ignore')[:200]
+            if text_content:
+                download_logger.debug(f"Response content: {text_content}")
+            return False
+
+        # Validate audio signature
+        is_valid_mp3 = False
+
+        # Check content type
+        if 'audio' in content_type or 'octet-stream' in content_type:
+            is_valid_mp3 = True
+            download_logger.debug(f"✅ Valid content type: {content_type}")
+
+        # Check MP3 signature (ID3 tag or frame sync)
+        if head.startswith(b'ID3'):  # ID3v2 tag
+            is_valid_mp3 = True
+            download_logger.debug(f"✅ ID3 tag detected")
+        elif len(head) > 2 and head[0:2] == b'\xff\xfb':  # MPEG Layer 3 sync
+            is_valid_mp3 = True
+            download_logger.debug(f"✅ MP3 frame sync detected")
+        elif len(head) > 2 and head[0] == 0xff and (head[1] & 0xe0) == 0xe0:  # Alternative MPEG sync
+            is_valid_mp3 = True
+            download_logger.debug(f"✅ MPEG frame sync detected")
+
+        # Check size (most MP3s are > 100KB)
+        if size > 100000:
+            is_valid_mp3 = True
+            download_logger.debug(f"✅ File size reasonable ({size} bytes)")
+
+        if not is_valid_mp3:
+            download_logger.warning(f"⚠️  Content validation failed - may not be valid audio")
+            download_logger.debug(f"Content type: {content_type}, Size: {size}, First bytes: {head[:20].hex()}")
+
+            # But try to save anyway if size is reasonable
+            if size > 10000:
+                download_logger.info(f"ℹ️  Attempting to save despite validation concerns...")
+            else:
                 return False
 
-            # Validate audio signature
-            is_valid_mp3 = False
-            
-            # Check content type
-            if 'audio' in content_type or 'octet-stream' in content_type:
-                is_valid_mp3 = True
-                download_logger.debug(f"✅ Valid content type: {content_type}")
-
-            # Check MP3 signature (ID3 tag or frame sync)
-            if content.startswith(b'ID3'):  # ID3v2 tag
-                is_valid_mp3 = True
-                download_logger.debug(f"✅ ID3 tag detected")
-            elif len(content) > 2 and content[0:2] == b'\xff\xfb':  # MPEG Layer 3 sync
-                is_valid_mp3 = True
-                download_logger.debug(f"✅ MP3 frame sync detected")
-            elif len(content) > 2 and content[0] == 0xff and (content[1] & 0xe0) == 0xe0:  # Alternative MPEG sync
-                is_valid_mp3 = True
-                download_logger.debug(f"✅ MPEG frame sync detected")
-
-            # Check size (most MP3s are > 100KB)
-            if len(content) > 100000:
-                is_valid_mp3 = True
-                download_logger.debug(f"✅ File size reasonable ({len(content)} bytes)")
-
-            if not is_valid_mp3:
-                download_logger.warning(f"⚠️  Content validation failed - may not be valid audio")
-                download_logger.debug(f"Content type: {content_type}, Size: {len(content)}, First bytes: {content[:20].hex()}")
-                
-                # But try to save anyway if size is reasonable
-                if len(content) > 10000:
-                    download_logger.info(f"ℹ️  Attempting to save despite validation concerns...")
-                else:
-                    return False
+        return True
+
+    async def _validate_and_save_audio(self, content: bytes, content_type: str, download_path: Path, song_title: str) -> bool:
+        """Validate an in-memory audio payload and save it to disk"""
+        try:
+            if not self._check_audio(content[:200], len(content), content_type):
+                return False
 
-            # Save to disk
+            # Save to disk; every blocking step runs in one worker-thread hop
             try:
-                download_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(download_path, 'wb') as f:
-                    f.write(content)
-                
-                # Verify file was written
-                if download_path.exists():
-                    actual_size = download_path.stat().st_size
-                    download_logger.info(f"✅ Successfully saved {song_title} ({actual_size} bytes)")
-                    return True
-                else:
-                    download_logger.error(f"❌ File was not created at {download_path}")
-                    return False
+                actual_size = await asyncio.to_thread(write_bytes, download_path, content)
+                download_logger.info(f"✅ Successfully saved {song_title} ({actual_size} bytes)")
+                return True
 
             except IOError as e:
                 download_logger.error(f"❌ Failed to write file: {e}")
@@ -2586,6 +3280,26 @@ class SpotDownAPI:
             download_logger.error(f"❌ Audio validation failed: {e}")
             return False
 
+    async def _stream_audio_to_file(self, response, content_type: str, download_path: Path, song_title: str) -> bool:
+        """Stream an audio response to disk in 64 KiB chunks, then validate it
+
+        Writes to a '.part' file that only replaces `download_path` once the
+        whole body passed _check_audio, so memory stays flat per download.
+        """
+        await asyncio.to_thread(download_path.parent.mkdir, parents=True, exist_ok=True)
+        part_path = download_path.with_name(download_path.name + '.part')
+        try:
+            head, total = await stream_to_file(response, part_path)
+
+            download_logger.debug(f"📥 Response size: {total} bytes, Type: {content_type}")
+            if not self._check_audio(head, total, content_type):
+                return False
+
+            await asyncio.to_thread(os.replace, part_path, download_path)
+            download_logger.info(f"✅ Successfully saved {song_title} ({total} bytes)")
+            return True
+        finally:
+            await asyncio.to_thread(part_path.unlink, missing_ok=True)
 
     async def _try_spotify_youtube_ytdlp(self, song_url: str, song_title: str, download_path: Path) -> bool:
         """Try Spotify→YouTube→yt-dlp method"""
@@ -2628,7 +3342,8 @@ class SpotDownAPI:
                 try:
                     # Pass the path without the extension
                     output_path_without_ext = download_path.with_suffix('')
-                    success = download_audio_ytdlp(youtube_url, str(output_path_without_ext))
+                    # yt-dlp blocks for the whole download; keep it off the event loop
+                    success = await asyncio.to_thread(download_audio_ytdlp, youtube_url, str(output_path_without_ext))
                     if success:
                         download_logger.info(f"✅ Successfully downloaded {song_title} using {converter_used}→yt-dlp")
                         return True
@@ -2679,7 +3394,6 @@ class SpotDownAPI:
         
         for domain_idx, base_domain in enumerate(domains_to_try):
             download_logger.debug(f"🔄 Trying domain ({domain_idx + 1}/{len(domains_to_try)}): {base_domain}")
-            self.current_base_url = base_domain
             
             for attempt in range(MAX_API_ATTEMPTS):
                 try:
@@ -2700,18 +3414,22 @@ class SpotDownAPI:
                         break  # Try next domain
 
                     # Step 2: Download the actual song
-                    success = await self._download_with_session(song_url, download_path, song_title)
+                    # The domain travels with the call: concurrent downloads may be on other mirrors
+                    success = await self._download_with_session(song_url, download_path, song_title, base_domain)
                     if success:
                         download_logger.info(f"✅ Successfully downloaded {song_title} using SpotDown from {base_domain}")
                         if self.failed_requests > 0:
                             self.failed_requests = max(0, self.failed_requests - 1)
-                        self.current_base_url = self.BASE_URL  # Reset to default
                         return True
 
                     # Step 2 failed, log and handle
                     download_logger.warning(f"Download failed on attempt {attempt_num}")
                     await self._handle_api_failure()
 
+                except PermanentDownloadError as e:
+                    # Retrying the same request won't help; move on to the next domain
+                    download_logger.warning(f"SpotDown rejected {song_title} on {base_domain} ({e}), not retrying")
+                    break
                 except asyncio.TimeoutError:
                     download_logger.warning(f"Timeout on attempt {attempt + 1} with domain {base_domain}")
                     await self._handle_api_failure()
@@ -2721,27 +3439,23 @@ class SpotDownAPI:
 
                 # Implement exponential backoff between retries
                 if attempt < MAX_API_ATTEMPTS - 1:
-                    delay = RETRY_DELAY_SECONDS * (2 ** attempt) + random.uniform(1, 3)
+                    delay = retry_delay(attempt)
                     download_logger.info(f"⏳ Waiting {delay:.1f}s before retry...")
                     await asyncio.sleep(delay)
             
             # If we exhausted attempts for this domain, try next one
             download_logger.debug(f"Exhausted attempts for domain {base_domain}, trying next...")
 
-        # Reset to default domain
-        self.current_base_url = self.BASE_URL
         download_logger.warning(f"❌ SpotDown method failed for: {song_title} after trying all domains")
         return False
 
-    async def download_song(self, song_url_or_data, download_path: Path):
-        """Download song using configurable priority order"""
-        # Handle both string URL and dict data
-        if isinstance(song_url_or_data, dict):
-            song_url = song_url_or_data.get('url', '')
-            song_title = song_url_or_data.get('title', 'Unknown')
-        else:
-            song_url = song_url_or_data
-            song_title = 'Unknown'
+    async def download_song(self, song: Dict, download_path: Path):
+        """Download song using configurable priority order
+
+        `song` is a song entry as stored in the DB (at least 'url'; 'title' is used for logs).
+        """
+        song_url = song.get('url', '')
+        song_title = song.get('title', 'Unknown')
 
         # Get configured priority order
         priority_order = get_download_priority()
@@ -2754,7 +3468,7 @@ class SpotDownAPI:
                 continue
 
             method_info = DOWNLOAD_METHODS[method_id]
-            if not method_info['available']():
+            if not method_info['available']:
                 download_logger.info(f"⏭️ Skipping {method_info['name']} - not available")
                 continue
 
@@ -2853,7 +3567,7 @@ async def handle_youtube_playlist_url(update: Update, context: ContextTypes.DEFA
     playlist_url = update.message.text
     sent_message = await update.message.reply_text("🔍 Analyzing YouTube playlist URL...")
 
-    playlist_info_yt = get_playlist_info(playlist_url)
+    playlist_info_yt = await asyncio.to_thread(get_playlist_info, playlist_url)
     if not playlist_info_yt or 'entries' not in playlist_info_yt:
         await sent_message.edit_text("❌ Could not get YouTube playlist information.")
         return
@@ -2917,45 +3631,59 @@ async def perform_youtube_playlist_download(update: Update, context: ContextType
 
     await update.callback_query.edit_message_text(f"Starting download of YouTube playlist '{playlist_name}'... ⏳")
 
-    total_videos, downloaded_count, failed_videos = len(videos), 0, []
-    successfully_downloaded_songs = []
+    total_videos = len(videos)
+    progress = {'done': 0, 'current': ''}
+    sem = asyncio.Semaphore(MAX_DOWNLOAD_CONCURRENCY)
+
+    # One directory listing instead of an exists() call per video
+    existing_files = await asyncio.to_thread(list_dir_files, playlist_dir)
 
-    for i, video in enumerate(videos):
+    async def _download_one(video):
+        """Download one video as mp3 and return its DB entry, or None on failure"""
         video_title = sanitize_filename(video.get('title', 'Unknown'))
         video_url = video.get('url', None)
         if not video_url:
-            failed_videos.append(video_title)
-            continue
-        
+            progress['done'] += 1
+            return None
+
         file_path = playlist_dir / f"{video_title}"
 
         duration_seconds = video.get('duration', 0)
         minutes = duration_seconds // 60
         seconds = duration_seconds % 60
         duration_str = f"{minutes}:{seconds:02d}"
+        song_entry = {'title': video_title, 'artist': 'YouTube', 'url': video_url, 'source': 'youtube', 'duration': duration_str}
 
-        if file_path.with_suffix('.mp3').exists():
-            downloaded_count += 1
-            successfully_downloaded_songs.append({'title': video_title, 'artist': 'YouTube', 'url': video_url, 'source': 'youtube', 'duration': duration_str})
-            continue
+        # yt-dlp appends the extension to the full title (with_suffix would cut titles
+        # containing a dot), which is also the name song_filename expects
+        if f"{video_title}.mp3" in existing_files:
+            progress['done'] += 1
+            return song_entry
 
-        await update.callback_query.edit_message_text(
-            f"📥 Downloading {i+1}/{total_videos}: *{video_title}*\n"
-            f"Playlist: *{playlist_name}*",
-            parse_mode=ParseMode.MARKDOWN
+        async with sem:
+            progress['current'] = video_title
+            success = await asyncio.to_thread(download_audio_ytdlp, video_url, str(file_path))
+
+        progress['done'] += 1
+        return song_entry if success else None
+
+    def _render(state):
+        return (
+            f"📥 Downloading {state['done']}/{total_videos}: *{escape_markdown(state['current'])}*\n"
+            f"Playlist: *{escape_markdown(playlist_name)}*"
         )
 
-        success = download_audio_ytdlp(video_url, str(file_path))
+    # Videos download concurrently; the message is refreshed on a timer instead of per video
+    progress_task = asyncio.create_task(report_progress(update.callback_query, progress, _render))
+    try:
+        results = await asyncio.gather(*[_download_one(video) for video in videos], return_exceptions=True)
+    finally:
+        await stop_progress(progress_task)
 
-        if success:
-            downloaded_count += 1
-            duration_seconds = video.get('duration', 0)
-            minutes = duration_seconds // 60
-            seconds = duration_seconds % 60
-            duration_str = f"{minutes}:{seconds:02d}"
-            successfully_downloaded_songs.append({'title': video_title, 'artist': 'YouTube', 'url': video_url, 'source': 'youtube', 'duration': duration_str})
-        else:
-            failed_videos.append(video_title)
+    # Keep playlist order for the saved songs
+    successfully_downloaded_songs = [entry for entry in results if isinstance(entry, dict)]
+    downloaded_count = len(successfully_downloaded_songs)
+    failed_videos = [video.get('title', 'Unknown') for video, entry in zip(videos, results) if not isinstance(entry, dict)]
 
     db = load_db()
     db[playlist_id] = {
@@ -2965,7 +3693,7 @@ async def perform_youtube_playlist_download(update: Update, context: ContextType
         'path': str(playlist_dir),
         'source': 'youtube'
     }
-    save_db(db)
+    await save_db_async(db)
 
     final_message = f"✅ Download completed for '{playlist_name}'!\n\n▪️ Successful: {downloaded_count}/{total_videos}\n"
     if failed_videos:
@@ -3007,6 +3735,118 @@ async def confirm_download_prompt(update: Update, context: ContextTypes.DEFAULT_
 
     context.user_data['state'] = None  # Clear state
 
+async def report_progress(query, state: dict, render, interval: float = PROGRESS_UPDATE_SECONDS):
+    """Refresh a progress message from shared state until cancelled
+
+    Concurrent download workers only update `state`; this task edits the message
+    at most once per `interval`, since Telegram rate-limits edits per chat.
+    """
+    last_text = None
+    delay = interval
+    while True:
+        await asyncio.sleep(delay)
+        delay = interval
+        text = render(state)
+        if text == last_text:
+            continue
+        try:
+            await query.edit_message_text(text, parse_mode=ParseMode.MARKDOWN)
+            last_text = text
+        except RetryAfter as e:
+            # Flood control: wait as long as Telegram asks instead of retrying every interval
+            retry_after = e.retry_after
+            delay = max(interval, retry_after.total_seconds() if isinstance(retry_after, timedelta) else retry_after)
+            logger.debug(f"Progress updates throttled by Telegram for {delay}s")
+        except Exception as e:
+            logger.debug(f"Skipped progress update: {e}")
+
+async def stop_progress(progress_task: asyncio.Task):
+    """Cancel a report_progress task and wait until it has stopped
+
+    Waiting matters: an edit already in flight could otherwise land after the
+    caller's final message and overwrite it.
+    """
+    progress_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await progress_task
+
+def song_filename(song: dict, source: str = 'spotify') -> str:
+    """File name a song is stored under inside its playlist folder"""
+    artist = None if source == 'youtube' else song.get('artist', 'Unknown')
+    return _song_filename(song.get('title', 'Unknown'), artist)
+
+@functools.lru_cache(maxsize=16384)
+def _song_filename(title: str, artist: Optional[str]) -> str:
+    """song_filename memoized on the raw fields, so a sync, integrity check or fix
+    revisiting the same songs does one cache lookup per song instead of sanitizing
+    title and artist separately and rebuilding the name"""
+    song_title = sanitize_filename(title)
+    if artist is None:
+        return f"{song_title}.mp3"
+    return f"{sanitize_filename(artist)} - {song_title}.mp3"
+
+async def download_songs_with_progress(query, songs: list, playlist_dir: Path, playlist_name: str,
+                                       source: str = 'spotify'):
+    """Download songs into a playlist folder concurrently, with retries and a progress message
+
+    Songs already on disk count as downloaded. Returns (downloaded_songs, failed_titles),
+    both in the order of `songs`.
+    """
+    progress = {'done': 0, 'current': ''}
+    sem = asyncio.Semaphore(MAX_DOWNLOAD_CONCURRENCY)
+    # One listing up front; a Path is only built for songs that need downloading
+    existing_files = await asyncio.to_thread(list_dir_files, playlist_dir)
+
+    async def _download_one(song):
+        """Download one song (with retries) and report whether it is on disk"""
+        file_name = song_filename(song, source)
+        if file_name in existing_files:
+            progress['done'] += 1
+            return True
+
+        song_title = sanitize_filename(song.get('title', 'Unknown'))
+        file_path = playlist_dir / file_name
+
+        # --- RETRY LOGIC ---
+        success = False
+        async with sem:
+            progress['current'] = song_title
+            for attempt in range(MAX_DOWNLOAD_ATTEMPTS):
+                if source == 'youtube':
+                    success = await asyncio.to_thread(download_audio_ytdlp, song['url'], str(file_path.with_suffix('')))
+                else:
+                    success = await api_client.download_song(song, file_path)
+                if success:
+                    break
+                if attempt < MAX_DOWNLOAD_ATTEMPTS - 1:
+                    delay = retry_delay(attempt)
+                    download_logger.info(f"Failed to download {song_title} (Attempt {attempt + 1}/{MAX_DOWNLOAD_ATTEMPTS}). Retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+
+        progress['done'] += 1
+        if success:
+            download_logger.info(f"Successfully downloaded: {song_title}")
+        else:
+            download_logger.warning(f"Failed to download: {song_title}")
+        return success
+
+    def _render(state):
+        return (
+            f"📥 Downloading {state['done']}/{len(songs)}: *{escape_markdown(state['current'])}*\n"
+            f"Playlist: *{escape_markdown(playlist_name)}*"
+        )
+
+    # Songs download concurrently; the message is refreshed on a timer instead of per song
+    progress_task = asyncio.create_task(report_progress(query, progress, _render))
+    try:
+        results = await asyncio.gather(*[_download_one(song) for song in songs], return_exceptions=True)
+    finally:
+        await stop_progress(progress_task)
+
+    downloaded_songs = [song for song, ok in zip(songs, results) if ok is True]
+    failed_titles = [song.get('title', 'Unknown') for song, ok in zip(songs, results) if ok is not True]
+    return downloaded_songs, failed_titles
+
 async def perform_download(update: Update, context: ContextTypes.DEFAULT_TYPE):
     info = context.user_data.get('playlist_info')
     if not info:
@@ -3026,50 +3866,11 @@ async def perform_download(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await update.callback_query.edit_message_text(f"Starting download in '{playlist_name}'... ⏳")
 
-    total_songs, downloaded_count, failed_songs = len(songs), 0, []
-    successfully_downloaded_songs = []  # Track only successfully downloaded songs
-
-    for i, song in enumerate(songs):
-        song_title = sanitize_filename(song.get('title', 'Unknown'))
-        artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-        file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
-
-        if file_path.exists():
-            downloaded_count += 1
-            successfully_downloaded_songs.append(song)  # Add to successfully downloaded
-            continue
-
-        await update.callback_query.edit_message_text(
-            f"📥 Downloading {i+1}/{total_songs}: *{song_title}*\n"
-            f"Playlist: *{playlist_name}*",
-            parse_mode=ParseMode.MARKDOWN
-        )
-
-        # --- RETRY LOGIC ---
-        success = False
-        for attempt in range(MAX_DOWNLOAD_ATTEMPTS):
-            # Use the song URL like in the original working code
-            success = await api_client.download_song(song, file_path)
-            if success:
-                break
-            else:
-                if attempt < MAX_DOWNLOAD_ATTEMPTS - 1:  # Only show retry message if not the last attempt
-                    await update.callback_query.edit_message_text(
-                        f"⚠️ Failed to download {song_title} (Attempt {attempt + 1}/{MAX_DOWNLOAD_ATTEMPTS}). Retrying in {RETRY_DELAY_SECONDS}s...",
-                    )
-                    await asyncio.sleep(RETRY_DELAY_SECONDS)
-                else:
-                    await update.callback_query.edit_message_text(
-                        f"❌ Failed to download {song_title} after {MAX_DOWNLOAD_ATTEMPTS} attempts.",
-                    )
-
-        if success:
-            downloaded_count += 1
-            successfully_downloaded_songs.append(song)  # Only add if successful
-            download_logger.info(f"Successfully downloaded and saved to DB: {song_title}")
-        else:
-            failed_songs.append(song_title)
-            download_logger.warning(f"Failed to download, NOT saving to DB: {song_title}")
+    total_songs = len(songs)
+    successfully_downloaded_songs, failed_songs = await download_songs_with_progress(
+        update.callback_query, songs, playlist_dir, playlist_name
+    )
+    downloaded_count = len(successfully_downloaded_songs)
 
     # Only save successfully downloaded songs to database
     db = load_db()
@@ -3079,7 +3880,7 @@ async def perform_download(update: Update, context: ContextTypes.DEFAULT_TYPE):
         'songs': successfully_downloaded_songs,  # Only successful downloads
         'path': str(playlist_dir)
     }
-    save_db(db)
+    await save_db_async(db)
 
     download_logger.info(f"Saved {len(successfully_downloaded_songs)}/{total_songs} songs to database for '{playlist_name}'")
 
@@ -3092,7 +3893,7 @@ async def perform_download(update: Update, context: ContextTypes.DEFAULT_TYPE):
     context.user_data.pop('playlist_info', None)
 
 async def list_playlists(update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 0):
-    db = load_db()
+    db = load_db(readonly=True)
     if not db:
         await update.callback_query.edit_message_text("You have no saved playlists.", reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("➕ Add one", callback_data='add_playlist_prompt')]]))
         return
@@ -3182,7 +3983,7 @@ async def perform_update(update: Update, context: ContextTypes.DEFAULT_TYPE, pla
     try:
         # Get current online playlist data based on source
         if source == 'youtube':
-            online_data = get_playlist_info(playlist_url)
+            online_data = await asyncio.to_thread(get_playlist_info, playlist_url)
             if not online_data or 'entries' not in online_data:
                 await update.callback_query.edit_message_text("❌ Could not fetch updated YouTube playlist data.")
                 return
@@ -3197,27 +3998,25 @@ async def perform_update(update: Update, context: ContextTypes.DEFAULT_TYPE, pla
 
         saved_songs = playlist_data.get('songs', [])
 
-        # Find new songs by comparing URLs AND checking if files actually exist
+        # The JSON is the truth for what is saved; the disk listing exposes saved songs whose file is gone
         playlist_dir = MUSIC_DIR / playlist_name
-        saved_urls = set()
+        existing_files = await asyncio.to_thread(list_dir_files, playlist_dir)
+        saved_url_set = {song['url'] for song in saved_songs if song.get('url')}
+        missing_urls = set()
 
-        # Only consider songs as "saved" if they exist both in JSON AND on disk
         for song in saved_songs:
-            song_url = song.get('url', '')
-            if song_url:
-                # Check if file actually exists
-                if source == 'youtube':
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    file_path = playlist_dir / f"{song_title}.mp3"
-                else:
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-                    file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
-
-                if file_path.exists():
-                    saved_urls.add(song_url)
+            song_url = song.get('url')
+            if not song_url:
+                continue
+            if song_filename(song, source) not in existing_files:
+                missing_urls.add(song_url)
 
-        new_songs = [song for song in online_songs if song.get('url', '') not in saved_urls]
+        # Songs not in the JSON yet, plus saved songs that are still online but missing on disk
+        new_songs = [
+            song for song in online_songs
+            if song.get('url', '') not in saved_url_set or song.get('url') in missing_urls
+        ]
+        redownload_count = sum(1 for song in new_songs if song.get('url') in missing_urls)
 
         if new_songs:
             # Store new songs temporarily for download but DON'T save to JSON yet
@@ -3226,7 +4025,9 @@ async def perform_update(update: Update, context: ContextTypes.DEFAULT_TYPE, pla
 
             message = f"✅ *Playlist Update Available!*\n\n"
             message += f"*{playlist_name}*\n"
-            message += f"▪️ Found {len(new_songs)} new songs\n"
+            message += f"▪️ Found {len(new_songs) - redownload_count} new songs\n"
+            if redownload_count:
+                message += f"▪️ {redownload_count} saved songs missing on disk will be re-downloaded\n"
             message += f"▪️ Current saved songs: {len(playlist_data['songs'])}\n\n"
             message += "New songs will only be saved to database after successful download."
 
@@ -3293,55 +4094,16 @@ async def download_new_songs(update: Update, context: ContextTypes.DEFAULT_TYPE,
 
         await update.callback_query.edit_message_text(f"📥 Downloading {len(new_songs)} new songs...")
 
-        downloaded_count = 0
-        failed_songs = []
-        successfully_downloaded_songs = []
-
-        for i, song in enumerate(new_songs):
-            if source == 'youtube':
-                song_title = sanitize_filename(song.get('title', 'Unknown'))
-                file_path = playlist_dir / f"{song_title}.mp3"
-            else:
-                song_title = sanitize_filename(song.get('title', 'Unknown'))
-                artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-                file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
-
-            if file_path.exists():
-                downloaded_count += 1
-                successfully_downloaded_songs.append(song)  # Already exists, count as success
-                continue
-
-            await update.callback_query.edit_message_text(
-                f"📥 Downloading {i+1}/{len(new_songs)}: *{song_title}*\n"
-                f"Playlist: *{playlist_name}*",
-                parse_mode=ParseMode.MARKDOWN
-            )
-
-            # Try to download with retries
-            success = False
-            for attempt in range(MAX_DOWNLOAD_ATTEMPTS):
-                if source == 'youtube':
-                    success = download_audio_ytdlp(song['url'], str(file_path.with_suffix('')))
-                else:
-                    success = await api_client.download_song(song, file_path)
-                if success:
-                    break
-                if attempt < MAX_DOWNLOAD_ATTEMPTS - 1:  # Only sleep if not the last attempt
-                    await asyncio.sleep(RETRY_DELAY_SECONDS)
-
-            if success:
-                downloaded_count += 1
-                successfully_downloaded_songs.append(song)  # Only add if successful
-                download_logger.info(f"Successfully downloaded new song: {song_title}")
-            else:
-                failed_songs.append(song_title)
-                download_logger.warning(f"Failed to download new song: {song_title}")
+        successfully_downloaded_songs, failed_songs = await download_songs_with_progress(
+            update.callback_query, new_songs, playlist_dir, playlist_name, source
+        )
+        downloaded_count = len(successfully_downloaded_songs)
 
         # Only add successfully downloaded songs to the database
         if successfully_downloaded_songs:
             playlist_data['songs'].extend(successfully_downloaded_songs)
             db[playlist_id] = playlist_data
-            save_db(db)
+            await save_db_async(db)
             download_logger.info(f"Added {len(successfully_downloaded_songs)} new songs to database for '{playlist_name}'")
 
         final_message = f"✅ *New Songs Downloaded!*\n\n"
@@ -3369,7 +4131,7 @@ async def download_new_songs(update: Update, context: ContextTypes.DEFAULT_TYPE,
 
 async def perform_delete(update: Update, context: ContextTypes.DEFAULT_TYPE, playlist_id: str):
     """Delete playlist with confirmation"""
-    db = load_db()
+    db = load_db(readonly=True)
     logger.info(f"Attempting to delete playlist: '{playlist_id}'")
     logger.info(f"Available playlists in DB: {list(db.keys())}")
 
@@ -3428,18 +4190,16 @@ async def confirm_delete_playlist(update: Update, context: ContextTypes.DEFAULT_
         logger.info(f"Attempting to delete playlist folder: {playlist_path}")
 
         if playlist_path.exists():
-            for file in playlist_path.iterdir():
-                if file.is_file():
-                    file.unlink()
-                    files_deleted += 1
-            playlist_path.rmdir()
+            # Count the files for the summary, then remove the whole tree off the event loop
+            files_deleted = len(await asyncio.to_thread(list_dir_files, playlist_path))
+            await asyncio.to_thread(shutil.rmtree, playlist_path)
             logger.info(f"Deleted playlist folder: {playlist_path}")
         else:
             logger.warning(f"Playlist folder not found at path: {playlist_path}")
 
         # Remove from database
         del db[playlist_id]
-        save_db(db)
+        await save_db_async(db)
 
         # Show success message
         message = f"✅ *Playlist Deleted Successfully!*\n\n"
@@ -3469,17 +4229,18 @@ async def confirm_delete_playlist(update: Update, context: ContextTypes.DEFAULT_
 
 async def show_settings(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show current bot settings"""
-    settings = load_settings()
+    settings = load_settings(readonly=True)
 
-    # Schedule initial sync if enabled and not yet scheduled
-    if settings.get('sync_enabled', False):
+    # Schedule initial sync if enabled and not yet scheduled (settings changes reschedule themselves)
+    job_queue = getattr(context, 'job_queue', None)
+    if settings.get('sync_enabled', False) and not (job_queue and job_queue.get_jobs_by_name('auto_sync')):
         await schedule_next_sync(context)
 
     last_sync = settings.get('last_sync')
     if last_sync:
         try:
             last_sync_dt = datetime.fromisoformat(last_sync)
-            last_sync_str = last_sync_dt.strftime('%Y-%m-%d %H:%M')
+            last_sync_str = last_sync_dt.strftime(_TS_FMT)
         except:
             last_sync_str = "Unknown"
     else:
@@ -3496,7 +4257,7 @@ async def show_settings(update: Update, context: ContextTypes.DEFAULT_TYPE):
     for i, method_id in enumerate(priority_order, 1):
         if method_id in DOWNLOAD_METHODS:
             method_info = DOWNLOAD_METHODS[method_id]
-            status = "✅" if method_info['available']() else "❌"
+            status = "✅" if method_info['available'] else "❌"
             priority_display.append(f"{i}. {status} {method_info['name']}")
 
     priority_text = "\n".join(priority_display) if priority_display else "No methods configured"
@@ -3506,7 +4267,7 @@ async def show_settings(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if settings.get('sync_enabled', False):
         next_sync_time = get_next_sync_time(settings)
         if next_sync_time:
-            next_sync_str = next_sync_time.strftime('%Y-%m-%d %H:%M')
+            next_sync_str = next_sync_time.strftime(_TS_FMT)
             next_sync_info = f"\n*Next Sync:* {next_sync_str}"
 
     text = f"""⚙️ *Bot Settings*
@@ -3543,7 +4304,7 @@ async def toggle_sync(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if settings['sync_enabled']:
         settings['user_id'] = update.effective_user.id
 
-    save_settings(settings)
+    await save_settings_async(settings)
 
     # Reschedule sync based on new setting
     await schedule_next_sync(context)
@@ -3555,7 +4316,6 @@ async def toggle_sync(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def configure_priority(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show download priority configuration menu"""
     priority_order = get_download_priority()
-    available_methods = get_available_methods()
 
     text = "🎯 *Configure Download Priority*\n\n"
     text += "Current order (methods are tried in this sequence):\n\n"
@@ -3563,7 +4323,7 @@ async def configure_priority(update: Update, context: ContextTypes.DEFAULT_TYPE)
     for i, method_id in enumerate(priority_order, 1):
         if method_id in DOWNLOAD_METHODS:
             method_info = DOWNLOAD_METHODS[method_id]
-            status = "✅" if method_info['available']() else "❌"
+            status = "✅" if method_info['available'] else "❌"
             text += f"{i}. {status} {method_info['name']}\n"
 
     text += "\nUse buttons below to reorder methods:"
@@ -3608,17 +4368,17 @@ async def handle_priority_change(update: Update, context: ContextTypes.DEFAULT_T
         # Swap with previous method
         priority_order[current_index], priority_order[current_index - 1] = \
             priority_order[current_index - 1], priority_order[current_index]
-        set_download_priority(priority_order)
+        await asyncio.to_thread(set_download_priority, priority_order)
         await update.callback_query.answer(f"✅ Moved {DOWNLOAD_METHODS[method_id]['name']} up")
     elif action == 'down' and current_index < len(priority_order) - 1:
         # Swap with next method
         priority_order[current_index], priority_order[current_index + 1] = \
             priority_order[current_index + 1], priority_order[current_index]
-        set_download_priority(priority_order)
+        await asyncio.to_thread(set_download_priority, priority_order)
         await update.callback_query.answer(f"✅ Moved {DOWNLOAD_METHODS[method_id]['name']} down")
     elif action == 'reset':
         default_priority = ['spotify_youtube_ytdlp', 'spotdl', 'spotdown']
-        set_download_priority(default_priority)
+        await asyncio.to_thread(set_download_priority, default_priority)
         await update.callback_query.answer("✅ Priority order reset to default")
     else:
         await update.callback_query.answer("❌ Cannot move method")
@@ -3631,7 +4391,7 @@ async def toggle_notifications(update: Update, context: ContextTypes.DEFAULT_TYP
     """Toggle sync result notifications on/off"""
     settings = load_settings()
     settings['notify_sync_results'] = not settings.get('notify_sync_results', True)
-    save_settings(settings)
+    await save_settings_async(settings)
 
     status = "enabled" if settings['notify_sync_results'] else "disabled"
     await update.callback_query.answer(f"Sync notifications {status}")
@@ -3639,12 +4399,7 @@ async def toggle_notifications(update: Update, context: ContextTypes.DEFAULT_TYP
 
 async def change_sync_day(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show day selection for sync"""
-    days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-
-    keyboard = []
-    for day in days:
-        keyboard.append([InlineKeyboardButton(day.title(), callback_data=f'sd_{day}')])
-
+    keyboard = [[InlineKeyboardButton(day.title(), callback_data=f'sd_{day}')] for day in SYNC_DAY_MAPPING]
     keyboard.append([InlineKeyboardButton("⬅️ Back", callback_data='show_settings')])
 
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -3655,9 +4410,13 @@ async def change_sync_day(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def set_sync_day(update: Update, context: ContextTypes.DEFAULT_TYPE, day: str):
     """Set the sync day"""
+    if day not in SYNC_DAY_MAPPING:
+        await update.callback_query.answer("❌ Unknown day")
+        return
+
     settings = load_settings()
     settings['sync_day'] = day
-    save_settings(settings)
+    await save_settings_async(settings)
 
     # Reschedule sync with new day
     await schedule_next_sync(context)
@@ -3679,11 +4438,12 @@ async def handle_sync_time(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Validate time format
     try:
-        time_obj = datetime.strptime(time_str, '%H:%M').time()
+        parse_sync_time(time_str)
 
         settings = load_settings()
         settings['sync_time'] = time_str
-        save_settings(settings)
+        await save_settings_async(settings)
+        await schedule_next_sync(context)
 
         await update.message.reply_text(f"✅ Sync time set to {time_str}")
         context.user_data['state'] = None
@@ -3790,7 +4550,7 @@ async def resync_individual_playlist(update: Update, context: ContextTypes.DEFAU
     try:
         # Get current online playlist data
         if source == 'youtube':
-            online_data = get_playlist_info(playlist_url)
+            online_data = await asyncio.to_thread(get_playlist_info, playlist_url)
             if not online_data or 'entries' not in online_data:
                 await update.callback_query.edit_message_text("❌ Could not fetch updated YouTube playlist data.")
                 return
@@ -3807,27 +4567,25 @@ async def resync_individual_playlist(update: Update, context: ContextTypes.DEFAU
 
         # Find new songs by comparing URLs AND checking if files actually exist
         playlist_dir = MUSIC_DIR / playlist_name
-        saved_urls = set()
+        existing_files = await asyncio.to_thread(list_dir_files, playlist_dir)
 
         # Only consider songs as "saved" if they exist both in JSON AND on disk
+        saved_on_disk = []
         for song in saved_songs:
             song_url = song.get('url', '')
             if song_url:
-                # Check if file actually exists
-                if source == 'youtube':
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    file_path = playlist_dir / f"{song_title}.mp3"
+                if song_filename(song, source) in existing_files:
+                    saved_on_disk.append(song_url)
                 else:
-                    song_title = sanitize_filename(song.get('title', 'Unknown'))
-                    artist_name = sanitize_filename(song.get('artist', 'Unknown'))
-                    file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
+                    logger.info(f"File missing for '{song.get('title', 'Unknown')}' - will be re-downloaded")
+        saved_urls = frozenset(saved_on_disk)
 
-                if file_path.exists():
-                    saved_urls.add(song_url)
-                else:
-                    logger.info(f"File missing for '{song_title}' - will be re-downloaded")
-
-        new_songs = [song for song in online_songs if song.get('url', '') not in saved_urls]
+        # URL -> online song, keeping playlist order; duplicate entries collapse to one download
+        url_to_song = {}
+        for song in online_songs:
+            if song.get('url'):
+                url_to_song.setdefault(song['url'], song)
+        new_songs = [song for song_url, song in url_to_song.items() if song_url not in saved_urls]
 
         if not new_songs:
             message = f"✅ *{playlist_name}*\n\nNo new songs found. Playlist is up to date!"
@@ -3840,7 +4598,7 @@ async def resync_individual_playlist(update: Update, context: ContextTypes.DEFAU
             # Add successfully downloaded songs to database
             playlist_data['songs'].extend(successfully_downloaded)
             db[playlist_id] = playlist_data
-            save_db(db)
+            await save_db_async(db)
 
             if successfully_downloaded:
                 message = f"✅ *{playlist_name}* - Sync Complete\n\n"
@@ -3877,7 +4635,7 @@ async def resync_individual_playlist(update: Update, context: ContextTypes.DEFAU
 
 async def perform_integrity_check(update: Update, context: ContextTypes.DEFAULT_TYPE, playlist_id: str):
     """Check integrity of a specific playlist"""
-    db = load_db()
+    db = load_db(readonly=True)
     if playlist_id not in db:
         await update.callback_query.edit_message_text("❌ Playlist not found.")
         return
@@ -3890,12 +4648,14 @@ async def perform_integrity_check(update: Update, context: ContextTypes.DEFAULT_
     try:
         result = await check_playlist_integrity(playlist_id, playlist_data)
 
-        message = f"✅ *Integrity Check: {playlist_name}*\n\n"
-        message += f"📊 *Results:*\n"
-        message += f"▪️ Total songs: {result['total_songs']}\n"
-        message += f"▪️ Valid songs: {result['valid_songs']}\n"
-        message += f"▪️ Quality issues: {len(result['corrupted_songs'])}\n"
-        message += f"▪️ Missing songs: {len(result['missing_songs'])}\n"
+        parts = [
+            f"✅ *Integrity Check: {playlist_name}*\n\n",
+            f"📊 *Results:*\n",
+            f"▪️ Total songs: {result['total_songs']}\n",
+            f"▪️ Valid songs: {result['valid_songs']}\n",
+            f"▪️ Quality issues: {len(result['corrupted_songs'])}\n",
+            f"▪️ Missing songs: {len(result['missing_songs'])}\n",
+        ]
 
         keyboard = []
 
@@ -3905,26 +4665,34 @@ async def perform_integrity_check(update: Update, context: ContextTypes.DEFAULT_
 
             # Show details of corrupted/missing songs
             if result['corrupted_songs']:
-                message += f"\n⚠️ *Songs with quality issues:*\n"
-                for i, song in enumerate(result['corrupted_songs'][:5]):  # Show first 5
-                    message += f"▪️ {song['artist']} - {song['title']}\n"
+                parts.append(f"\n⚠️ *Songs with quality issues:*\n")
+                for song in result['corrupted_songs'][:5]:  # Show first 5
+                    parts.append(f"▪️ {song['artist']} - {song['title']}\n")
                 if len(result['corrupted_songs']) > 5:
-                    message += f"▪️ ... and {len(result['corrupted_songs']) - 5} more\n"
+                    parts.append(f"▪️ ... and {len(result['corrupted_songs']) - 5} more\n")
 
             if result['missing_songs']:
-                message += f"\n❌ *Missing songs:*\n"
-                for i, song in enumerate(result['missing_songs'][:5]):  # Show first 5
-                    message += f"▪️ {song['artist']} - {song['title']}\n"
+                parts.append(f"\n❌ *Missing songs:*\n")
+                for song in result['missing_songs'][:5]:  # Show first 5
+                    parts.append(f"▪️ {song['artist']} - {song['title']}\n")
                 if len(result['missing_songs']) > 5:
-                    message += f"▪️ ... and {len(result['missing_songs']) - 5} more\n"
-
-            # Store the results for fixing
-            context.user_data[f'integrity_result_{playlist_id}'] = result
+                    parts.append(f"▪️ ... and {len(result['missing_songs']) - 5} more\n")
+
+            # Store only what fix_corrupted_songs needs, not the whole report
+            context.user_data[f'integrity_result_{playlist_id}'] = {
+                'corrupted_songs': [
+                    {'file_path': song['file_path'], 'song_data': song['song_data']}
+                    for song in result['corrupted_songs']
+                ],
+                'missing_songs': [
+                    {'song_data': song['song_data']} for song in result['missing_songs']
+                ],
+            }
 
         keyboard.append([InlineKeyboardButton("⬅️ Back to Playlists", callback_data='list_playlists_0')])
 
         await update.callback_query.edit_message_text(
-            message,
+            ''.join(parts),
             reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode=ParseMode.MARKDOWN
         )
@@ -3948,7 +4716,7 @@ async def fix_integrity_issues(update: Update, context: ContextTypes.DEFAULT_TYP
         )
         return
 
-    db = load_db()
+    db = load_db(readonly=True)
     if playlist_id not in db:
         await update.callback_query.edit_message_text("❌ Playlist not found.")
         return
@@ -3992,7 +4760,7 @@ async def fix_integrity_issues(update: Update, context: ContextTypes.DEFAULT_TYP
 
 async def check_all_playlists_integrity(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Check integrity of all playlists"""
-    db = load_db()
+    db = load_db(readonly=True)
     if not db:
         await update.callback_query.edit_message_text(
             "No playlists found.",
@@ -4009,15 +4777,30 @@ async def check_all_playlists_integrity(update: Update, context: ContextTypes.DE
     total_missing = 0
     playlists_with_issues = []
 
-    try:
-        for i, (playlist_id, playlist_data) in enumerate(db.items()):
-            playlist_name = playlist_data.get('name', 'Unknown')
-
-            await update.callback_query.edit_message_text(
-                f"🔍 Checking {i+1}/{total_playlists}: {playlist_name}"
-            )
+    progress = {'done': 0, 'current': ''}
+    sem = asyncio.Semaphore(MAX_INTEGRITY_CONCURRENCY)
 
+    async def _check_one(playlist_id, playlist_data):
+        async with sem:
+            progress['current'] = playlist_data.get('name', 'Unknown')
             result = await check_playlist_integrity(playlist_id, playlist_data)
+        progress['done'] += 1
+        return result
+
+    def _render(state):
+        return f"🔍 Checked {state['done']}/{total_playlists} playlists\nNow: {escape_markdown(state['current'])}"
+
+    # Playlists are checked concurrently; the message is refreshed on a timer
+    progress_task = asyncio.create_task(report_progress(update.callback_query, progress, _render))
+    try:
+        try:
+            results = await asyncio.gather(*[_check_one(pid, pdata) for pid, pdata in db.items()])
+        finally:
+            # Also stops it when the gather fails or is cancelled
+            await stop_progress(progress_task)
+
+        for (playlist_id, playlist_data), result in zip(db.items(), results):
+            playlist_name = playlist_data.get('name', 'Unknown')
 
             total_songs += result['total_songs']
             total_valid += result['valid_songs']
@@ -4032,23 +4815,25 @@ async def check_all_playlists_integrity(update: Update, context: ContextTypes.DE
                     'missing': len(result['missing_songs'])
                 })
 
-        message = f"✅ *Global Integrity Check Complete*\n\n"
-        message += f"📊 *Summary:*\n"
-        message += f"▪️ Playlists checked: {total_playlists}\n"
-        message += f"▪️ Total songs: {total_songs}\n"
-        message += f"▪️ Valid songs: {total_valid}\n"
-        message += f"▪️ Quality issues: {total_corrupted}\n"
-        message += f"▪️ Missing songs: {total_missing}\n"
+        parts = [
+            f"✅ *Global Integrity Check Complete*\n\n",
+            f"📊 *Summary:*\n",
+            f"▪️ Playlists checked: {total_playlists}\n",
+            f"▪️ Total songs: {total_songs}\n",
+            f"▪️ Valid songs: {total_valid}\n",
+            f"▪️ Quality issues: {total_corrupted}\n",
+            f"▪️ Missing songs: {total_missing}\n",
+        ]
 
         if playlists_with_issues:
-            message += f"\n⚠️ *Playlists with issues:*\n"
+            parts.append(f"\n⚠️ *Playlists with issues:*\n")
             for playlist in playlists_with_issues[:10]:  # Show first 10
-                message += f"▪️ {playlist['name']}: {playlist['corrupted']} quality issues, {playlist['missing']} missing\n"
+                parts.append(f"▪️ {playlist['name']}: {playlist['corrupted']} quality issues, {playlist['missing']} missing\n")
 
         keyboard = [[InlineKeyboardButton("⬅️ Back to Playlists", callback_data='list_playlists_0')]]
 
         await update.callback_query.edit_message_text(
-            message,
+            ''.join(parts),
             reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode=ParseMode.MARKDOWN
         )
@@ -4062,7 +4847,7 @@ async def check_all_playlists_integrity(update: Update, context: ContextTypes.DE
 
 async def list_playlist_songs(update: Update, context: ContextTypes.DEFAULT_TYPE, playlist_id: str, page: int = 0):
     """List all songs in a playlist with delete buttons"""
-    db = load_db()
+    db = load_db(readonly=True)
     if playlist_id not in db:
         await update.callback_query.edit_message_text("❌ Playlist not found.")
         return
@@ -4087,30 +4872,28 @@ async def list_playlist_songs(update: Update, context: ContextTypes.DEFAULT_TYPE
     start_idx = page * songs_per_page
     end_idx = min(start_idx + songs_per_page, len(songs))
 
-    message = f"📋 *{escape_markdown(playlist_name)}*\n"
-    message += f"Page {page + 1}/{total_pages} • {len(songs)} total songs\n\n"
-
+    parts = [
+        f"📋 *{escape_markdown(playlist_name)}*\n",
+        f"Page {page + 1}/{total_pages} • {len(songs)} total songs\n\n",
+    ]
     keyboard = []
 
-    for i in range(start_idx, end_idx):
-        song = songs[i]
+    # One directory listing (off the event loop) instead of a stat per song shown
+    existing_files = await asyncio.to_thread(list_dir_files, MUSIC_DIR / playlist_name)
+
+    # Song lines and their delete buttons are built in the same pass
+    for i, song in enumerate(songs[start_idx:end_idx], start_idx):
         song_title = song.get('title', 'Unknown')
         artist_name = song.get('artist', 'Unknown')
         duration = song.get('duration', '0:00')
 
-        # Check if file exists
-        playlist_dir = MUSIC_DIR / playlist_name
-        if source == 'youtube':
-            file_path = playlist_dir / f"{sanitize_filename(song_title)}.mp3"
-        else:
-            file_path = playlist_dir / f"{sanitize_filename(artist_name)} - {sanitize_filename(song_title)}.mp3"
-        status_icon = "✅" if file_path.exists() else "❌"
-
-        message += f"{i+1}. {status_icon} *{escape_markdown(artist_name)}* - {escape_markdown(song_title)} ({escape_markdown(str(duration))})\n"
+        status_icon = "✅" if song_filename(song, source) in existing_files else "❌"
 
-        # Add delete button for each song
+        parts.append(f"{i+1}. {status_icon} *{escape_markdown(artist_name)}* - {escape_markdown(song_title)} ({escape_markdown(str(duration))})\n")
         keyboard.append([InlineKeyboardButton(f"🗑️ Delete #{i+1}", callback_data=f"delete_song_{playlist_id}_{i}")])
 
+    message = ''.join(parts)
+
     # Pagination buttons
     nav_buttons = []
     if page > 0:
@@ -4125,15 +4908,15 @@ async def list_playlist_songs(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     # Check message length and truncate if necessary to avoid parsing errors
     if len(message.encode('utf-8')) > 4000:  # Leave some margin from Telegram's 4096 limit
-        lines = message.split('\n')
-        truncated_message = ""
-        for line in lines:
-            if len((truncated_message + line + '\n').encode('utf-8')) < 3800:
-                truncated_message += line + '\n'
-            else:
+        kept = []
+        size = 0
+        for line in message.split('\n'):
+            size += len(line.encode('utf-8')) + 1
+            if size >= 3800:
                 break
-        truncated_message += f"\n... (message truncated for length)"
-        message = truncated_message
+            kept.append(line + '\n')
+        kept.append(f"\n... (message truncated for length)")
+        message = ''.join(kept)
 
     try:
         await update.callback_query.edit_message_text(
@@ -4153,7 +4936,7 @@ async def list_playlist_songs(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 async def delete_song(update: Update, context: ContextTypes.DEFAULT_TYPE, playlist_id: str, song_index: int):
     """Delete a specific song from playlist and filesystem"""
-    db = load_db()
+    db = load_db(readonly=True)
     logger.info(f"Attempting to delete song {song_index} from playlist: '{playlist_id}'")
     logger.info(f"Available playlists in DB: {list(db.keys())}")
 
@@ -4211,7 +4994,6 @@ async def confirm_delete_song(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
 
     song = songs[song_index]
-    song_title = sanitize_filename(song.get('title', 'Unknown'))
     artist_name = sanitize_filename(song.get('artist', 'Unknown'))
 
     source = playlist_data.get('source', 'spotify')
@@ -4225,10 +5007,7 @@ async def confirm_delete_song(update: Update, context: ContextTypes.DEFAULT_TYPE
             # Fallback to old method if no path stored
             playlist_dir = MUSIC_DIR / playlist_name
 
-        if source == 'youtube':
-            file_path = playlist_dir / f"{song_title}.mp3"
-        else:
-            file_path = playlist_dir / f"{artist_name} - {song_title}.mp3"
+        file_path = playlist_dir / song_filename(song, source)
         file_deleted = False
 
         logger.info(f"Attempting to delete file: {file_path}")
@@ -4244,7 +5023,7 @@ async def confirm_delete_song(update: Update, context: ContextTypes.DEFAULT_TYPE
         del songs[song_index]
         playlist_data['songs'] = songs
         db[playlist_id] = playlist_data
-        save_db(db)
+        await save_db_async(db)
 
         # Enhanced feedback message
         remaining_songs = len(songs)
@@ -4280,7 +5059,7 @@ async def confirm_delete_song(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 async def show_song_details(update: Update, context: ContextTypes.DEFAULT_TYPE, playlist_id: str, song_index: int):
     """Show details of a specific song from search results"""
-    db = load_db()
+    db = load_db(readonly=True)
     if playlist_id not in db:
         await update.callback_query.edit_message_text("❌ Playlist not found.")
         return
@@ -4300,7 +5079,7 @@ async def show_song_details(update: Update, context: ContextTypes.DEFAULT_TYPE,
 
     # Check if file exists
     playlist_dir = MUSIC_DIR / playlist_name
-    file_path = playlist_dir / f"{sanitize_filename(artist)} - {sanitize_filename(title)}.mp3"
+    file_path = playlist_dir / song_filename(song, playlist_data.get('source', 'spotify'))
     file_exists = file_path.exists()
 
     message = f"🎵 *Song Details*\n\n"
@@ -4325,7 +5104,7 @@ async def show_song_details(update: Update, context: ContextTypes.DEFAULT_TYPE,
     )
 
 async def show_playlists_for_adding_songs(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    db = load_db()
+    db = load_db(readonly=True)
     if not db:
         await update.callback_query.edit_message_text(
             "❌ No playlists found. Create a new playlist first.",
@@ -4387,7 +5166,7 @@ async def add_songs_to_playlist(update: Update, context: ContextTypes.DEFAULT_TY
     # Add new songs to playlist data
     playlist_data['songs'].extend(songs_to_add)
     db[playlist_id] = playlist_data
-    save_db(db)
+    await save_db_async(db)
 
     # Download the new songs
     context.user_data[f'new_songs_{playlist_id}'] = songs_to_add
@@ -4401,6 +5180,18 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     data = query.data
     logger.info(f"Button handler received callback_data: '{data}'")
 
+    # Callbacks that just forward to a handler are looked up in the routing tables
+    # (see CALLBACK ROUTING); the branches below build their reply inline
+    handler = CALLBACK_HANDLERS.get(data)
+    if handler:
+        await handler(update, context)
+        return
+
+    route = CALLBACK_PREFIX_HANDLERS.get(data.partition('_')[0])
+    if route and data.startswith(route[0]):
+        await route[1](update, context, data[len(route[0]):])
+        return
+
     if data == 'add_playlist_prompt':
         await query.edit_message_text("Send me a Spotify or YouTube playlist URL.")
         context.user_data['state'] = 'awaiting_url'
@@ -4445,13 +5236,6 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("Use suggested name", callback_data='use_suggested_name')]]))
         context.user_data['state'] = 'awaiting_playlist_name'
 
-    elif data == 'add_to_existing_playlist_prompt':
-        await show_playlists_for_adding_songs(update, context)
-
-    elif data.startswith('ast_'):
-        playlist_id = data.split('ast_')[1]
-        await add_songs_to_playlist(update, context, playlist_id)
-
     elif data == 'search_prompt':
         await query.edit_message_text(
             "🔍 *Search Songs*\n\n"
@@ -4460,37 +5244,6 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             parse_mode=ParseMode.MARKDOWN
         )
         context.user_data['state'] = 'awaiting_search'
-    elif data.startswith('list_playlists_'):
-        page = int(data.split('list_playlists_')[1])
-        await list_playlists(update, context, page=page)
-    elif data == 'show_settings':
-        await show_settings(update, context)
-    elif data == 'toggle_sync':
-        await toggle_sync(update, context)
-    elif data == 'toggle_notifications':
-        await toggle_notifications(update, context)
-    elif data == 'configure_priority':
-        await configure_priority(update, context)
-    elif data.startswith('pu_'):
-        method_id = data.replace('pu_', '')
-        await handle_priority_change(update, context, 'up', method_id)
-    elif data.startswith('pd_'):
-        method_id = data.replace('pd_', '')
-        await handle_priority_change(update, context, 'down', method_id)
-    elif data == 'priority_reset':
-        await handle_priority_change(update, context, 'reset', '')
-    elif data == 'change_sync_day':
-        await change_sync_day(update, context)
-    elif data == 'change_sync_time':
-        await change_sync_time(update, context)
-    elif data.startswith('sd_'):
-        day = data.split('sd_')[1]
-        await set_sync_day(update, context, day)
-    elif data == 'manual_sync':
-        await manual_sync(update, context)
-    elif data.startswith('rs_'):
-        playlist_id = data.split('rs_')[1]
-        await resync_individual_playlist(update, context, playlist_id)
     elif data == 'use_suggested_name':
         info = context.user_data['playlist_info']
         info['name'] = sanitize_filename(info['suggested_name'])
@@ -4498,91 +5251,12 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await confirm_youtube_playlist_download_prompt(update, context)
         else:
             await confirm_download_prompt(update, context)
-    elif data == 'confirm_download':
-        await perform_download(update, context)
-    elif data == 'confirm_youtube_playlist_download':
-        await perform_youtube_playlist_download(update, context)
-    elif data.startswith('upd_'):
-        playlist_id = data.split('upd_')[1]
-        await perform_update(update, context, playlist_id)
-    elif data.startswith('dn_'):
-        playlist_id = data.split('dn_')[1]
-        await download_new_songs(update, context, playlist_id)
-    elif data.startswith('delete_song_'):
-        # Format: delete_song_{playlist_id}_{song_index}
-        remaining = data.replace('delete_song_', '', 1)
-        parts = remaining.rsplit('_', 1)
-        playlist_id = parts[0]
-        song_index = int(parts[1])
-        await delete_song(update, context, playlist_id, song_index)
-    elif data.startswith('del_'):
-        playlist_id = data.split('del_')[1]
-        await perform_delete(update, context, playlist_id)
-    elif data.startswith('ci_'):
-        playlist_id = data.split('ci_')[1]
-        await perform_integrity_check(update, context, playlist_id)
-    elif data.startswith('fi_'):
-        playlist_id = data.split('fi_')[1]
-        await fix_integrity_issues(update, context, playlist_id)
-    elif data == 'check_all_integrity':
-        await check_all_playlists_integrity(update, context)
-    elif data.startswith('ls_'):
-        playlist_id = data.split('ls_')[1]
-        await list_playlist_songs(update, context, playlist_id)
-    elif data.startswith('sp_'):
-        # Format: sp_{playlist_id}_{page}
-        remaining = data.replace('sp_', '', 1)
-        parts = remaining.rsplit('_', 1)
-        playlist_id = parts[0]
-        page = int(parts[1])
-        await list_playlist_songs(update, context, playlist_id, page)
-    elif data.startswith('cdp_'):
-        playlist_id = data.split('cdp_')[1]
-        await confirm_delete_playlist(update, context, playlist_id)
-    elif data.startswith('cds_'):
-        # Format: cds_{playlist_id}_{song_index}
-        remaining = data.replace('cds_', '', 1)
-        parts = remaining.rsplit('_', 1)
-        playlist_id = parts[0]
-        song_index = int(parts[1])
-        await confirm_delete_song(update, context, playlist_id, song_index)
-    elif data.startswith('ss_'):
-        # Format: ss_{playlist_id}_{song_index}
-        remaining = data.replace('ss_', '', 1)
-        parts = remaining.rsplit('_', 1)
-        playlist_id = parts[0]
-        song_index = int(parts[1])
-        await show_song_details(update, context, playlist_id, song_index)
-    elif data == 'select_playlist_for_track':
-        await show_playlists_for_track(update, context)
     elif data == 'create_playlist_for_track':
         await query.edit_message_text(
             "📝 *Create New Playlist*\n\nSend me the name for the new playlist:",
             parse_mode=ParseMode.MARKDOWN
         )
         context.user_data['state'] = 'awaiting_track_playlist_name'
-    elif data.startswith('att_'):
-        playlist_id = data.split('att_')[1]
-        await add_track_to_playlist(update, context, playlist_id)
-    elif data.startswith('select_spotify_track_'):
-        track_index = int(data.split('select_spotify_track_')[1])
-        await select_spotify_track(update, context, track_index)
-    elif data == 'youtube_auto_filename':
-        await perform_youtube_download(update, context)
-    elif data == 'youtube_new_folder':
-        await youtube_download_to_new_folder(update, context)
-    elif data == 'youtube_select_playlist':
-        await youtube_select_playlist(update, context)
-    elif data == 'youtube_create_playlist':
-        await youtube_create_playlist(update, context)
-    elif data.startswith('yat_'):
-        playlist_id = data.split('yat_')[1]
-        await youtube_add_to_playlist(update, context, playlist_id)
-    elif data.startswith('syv_'):
-        video_index = int(data.split('syv_')[1])
-        await select_youtube_video(update, context, video_index)
-    elif data == 'auto_select_youtube':
-        await auto_select_youtube_video(update, context)
     elif data == 'youtube_back_to_options':
         # Recreate the original YouTube options menu
         youtube_info = context.user_data.get('youtube_track_info')
@@ -4867,7 +5541,7 @@ async def handle_youtube_url(update: Update, context: ContextTypes.DEFAULT_TYPE,
             await sent_message.edit_text("❌ YouTube downloader not available. Please install required dependencies.")
             return
 
-        video_info = get_video_info(youtube_url)
+        video_info = await asyncio.to_thread(get_video_info, youtube_url)
 
         if not video_info:
             await sent_message.edit_text("❌ Failed to process YouTube video. Please check the URL.")
@@ -4925,7 +5599,7 @@ async def youtube_download_to_new_folder(update: Update, context: ContextTypes.D
         parse_mode=ParseMode.MARKDOWN
     )
 
-    success = download_audio_ytdlp(youtube_info['url'], str(file_path))
+    success = await asyncio.to_thread(download_audio_ytdlp, youtube_info['url'], str(file_path))
 
     if success:
         # The actual file path will have an extension added by yt-dlp, so we need to find it.
@@ -5017,7 +5691,7 @@ async def youtube_add_to_playlist(update: Update, context: ContextTypes.DEFAULT_
         parse_mode=ParseMode.MARKDOWN
     )
 
-    success = download_audio_ytdlp(youtube_info['url'], str(file_path))
+    success = await asyncio.to_thread(download_audio_ytdlp, youtube_info['url'], str(file_path))
 
     if success:
         # Create song entry for database
@@ -5036,7 +5710,7 @@ async def youtube_add_to_playlist(update: Update, context: ContextTypes.DEFAULT_
         # Add to playlist
         playlist_data['songs'].append(song_entry)
         db[playlist_id] = playlist_data
-        save_db(db)
+        await save_db_async(db)
 
         final_file_path = file_path.with_suffix('.mp3')
         file_size = final_file_path.stat().st_size if final_file_path.exists() else 0
@@ -5087,7 +5761,7 @@ async def handle_youtube_playlist_name(update: Update, context: ContextTypes.DEF
         parse_mode=ParseMode.MARKDOWN
     )
 
-    success = download_audio_ytdlp(youtube_info['url'], str(file_path))
+    success = await asyncio.to_thread(download_audio_ytdlp, youtube_info['url'], str(file_path))
 
     if success:
         # Create song entry
@@ -5115,7 +5789,7 @@ async def handle_youtube_playlist_name(update: Update, context: ContextTypes.DEF
             'is_custom': True,
             'source': 'youtube'
         }
-        save_db(db)
+        await save_db_async(db)
 
         final_file_path = file_path.with_suffix('.mp3')
         file_size = final_file_path.stat().st_size if final_file_path.exists() else 0
@@ -5347,7 +6021,7 @@ async def handle_track_playlist_name(update: Update, context: ContextTypes.DEFAU
         'is_custom': True  # Mark as custom playlist for tracks
     }
 
-    save_db(db)
+    await save_db_async(db)
 
     # Download the track
     await download_track_to_playlist(update, context, playlist_id, track_info)
@@ -5386,7 +6060,7 @@ async def add_track_to_playlist(update: Update, context: ContextTypes.DEFAULT_TY
     existing_songs.append(normalized_track_info)
     playlist_data['songs'] = existing_songs
     db[playlist_id] = playlist_data
-    save_db(db)
+    await save_db_async(db)
 
     # Download the track
     await download_track_to_playlist(update, context, playlist_id, track_info, is_existing_playlist=True)
@@ -5448,7 +6122,7 @@ async def download_track_to_playlist(update: Update, context: ContextTypes.DEFAU
             download_logger.info(f"🎯 Using manually selected YouTube video: {youtube_url}")
 
             output_path_without_ext = file_path.with_suffix('')
-            download_success = download_audio_ytdlp(youtube_url, str(output_path_without_ext))
+            download_success = await asyncio.to_thread(download_audio_ytdlp, youtube_url, str(output_path_without_ext))
 
             # Clean up the selected video from context
             context.user_data.pop('selected_youtube_video', None)
@@ -5477,7 +6151,7 @@ async def download_track_to_playlist(update: Update, context: ContextTypes.DEFAU
             songs = [s for s in songs if s.get('url') != track_info.get('url')]
             playlist_data['songs'] = songs
             db[playlist_id] = playlist_data
-            save_db(db)
+            await save_db_async(db)
 
             success_message = f"❌ *Download Failed*\n\n"
             success_message += f"🎵 **Track:** {track_info.get('title', 'Unknown')} - {track_info.get('artist', 'Unknown')}\n"
@@ -5508,7 +6182,7 @@ async def download_track_to_playlist(update: Update, context: ContextTypes.DEFAU
         songs = [s for s in songs if s.get('url') != track_info.get('url')]
         playlist_data['songs'] = songs
         db[playlist_id] = playlist_data
-        save_db(db)
+        await save_db_async(db)
 
         error_message = f"❌ *Download Error*\n\n"
         error_message += f"🎵 **Track:** {track_info.get('title', 'Unknown')} - {track_info.get('artist', 'Unknown')}\n"
@@ -5534,8 +6208,22 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
     logger.error("Exception while handling an update:", exc_info=context.error)
 
 # --- SCHEDULING FUNCTIONS ---
-def get_next_sync_time(settings: Dict) -> Optional[datetime]:
-    """Calculate next sync time based on settings"""
+# Map day names to weekday numbers (0=Monday); also the order of the day picker
+SYNC_DAY_MAPPING = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+# Timestamp format for last/next sync times shown to the user
+_TS_FMT = '%Y-%m-%d %H:%M'
+
+@functools.lru_cache(maxsize=8)
+def parse_sync_time(time_str: str) -> time:
+    """Parse an 'HH:MM' sync time (memoized; raises ValueError if malformed)"""
+    return datetime.strptime(time_str, '%H:%M').time()
+
+def get_sync_schedule(settings: Dict) -> Optional[tuple]:
+    """Return (sync_time, weekday) from settings, or None if sync is off or misconfigured"""
     if not settings.get('sync_enabled', False):
         return None
 
@@ -5543,22 +6231,25 @@ def get_next_sync_time(settings: Dict) -> Optional[datetime]:
     sync_time_str = settings.get('sync_time', '09:00')
 
     try:
-        sync_time = datetime.strptime(sync_time_str, '%H:%M').time()
+        sync_time = parse_sync_time(sync_time_str)
     except ValueError:
         logger.error(f"Invalid sync time format: {sync_time_str}")
         return None
 
-    # Map day names to weekday numbers (0=Monday)
-    day_mapping = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-
-    target_weekday = day_mapping.get(sync_day.lower())
+    target_weekday = SYNC_DAY_MAPPING.get(sync_day.lower())
     if target_weekday is None:
         logger.error(f"Invalid sync day: {sync_day}")
         return None
 
+    return sync_time, target_weekday
+
+def get_next_sync_time(settings: Dict) -> Optional[datetime]:
+    """Calculate next sync time based on settings"""
+    schedule = get_sync_schedule(settings)
+    if schedule is None:
+        return None
+    sync_time, target_weekday = schedule
+
     # Get current time
     now = datetime.now()
     current_weekday = now.weekday()
@@ -5580,42 +6271,56 @@ def get_next_sync_time(settings: Dict) -> Optional[datetime]:
     return next_sync
 
 async def schedule_next_sync(context: ContextTypes.DEFAULT_TYPE):
-    """Schedule the next automatic sync"""
-    settings = load_settings()
-    next_sync_time = get_next_sync_time(settings)
+    """(Re)register the weekly automatic sync job from the current settings
 
-    if next_sync_time and hasattr(context, 'job_queue') and context.job_queue:
-        try:
-            # Remove existing sync jobs
-            current_jobs = context.job_queue.get_jobs_by_name('auto_sync')
-            for job in current_jobs:
-                job.schedule_removal()
-
-            # Schedule new sync
-            context.job_queue.run_once(
-                auto_sync_job,
-                when=next_sync_time,
-                name='auto_sync'
-            )
+    The job repeats on its own (run_daily restricted to one weekday). Besides settings
+    changes, auto_sync_job calls this after every run so the next run's UTC offset is
+    re-derived for its own date and a DST change can't shift it by an hour.
+    """
+    settings = load_settings(readonly=True)
+    schedule = get_sync_schedule(settings)
 
-            logger.info(f"Next auto sync scheduled for: {next_sync_time}")
-            sync_logger.info(f"Next auto sync scheduled for: {next_sync_time}")
-        except Exception as e:
-            logger.warning(f"Could not schedule sync: {e}")
-    elif next_sync_time:
-        logger.info(f"Would schedule sync for: {next_sync_time} (job queue not available)")
-    else:
-        logger.info("Auto sync is disabled")
+    if not (hasattr(context, 'job_queue') and context.job_queue):
+        if schedule:
+            logger.info(f"Would schedule sync for: {get_next_sync_time(settings)} (job queue not available)")
+        return
+
+    try:
+        # Remove existing sync jobs
+        for job in context.job_queue.get_jobs_by_name('auto_sync'):
+            job.schedule_removal()
+
+        if schedule is None:
+            logger.info("Auto sync is disabled")
+            return
+
+        sync_time, target_weekday = schedule
+        # Settings hold local wall-clock time; the job queue's days count 0=Sunday. Use
+        # the UTC offset in force at the next run, not the one in force today
+        local_tz = get_next_sync_time(settings).astimezone().tzinfo
+        context.job_queue.run_daily(
+            auto_sync_job,
+            time=sync_time.replace(tzinfo=local_tz),
+            days=((target_weekday + 1) % 7,),
+            name='auto_sync'
+        )
+
+        next_sync_time = get_next_sync_time(settings)
+        logger.info(f"Next auto sync scheduled for: {next_sync_time}")
+        sync_logger.info(f"Next auto sync scheduled for: {next_sync_time}")
+    except Exception as e:
+        logger.warning(f"Could not schedule sync: {e}")
 
 async def auto_sync_job(context: ContextTypes.DEFAULT_TYPE):
     """Job function for automatic sync"""
     sync_logger.info("Starting scheduled automatic sync")
 
     try:
-        result = await sync_manager.sync_all_playlists(context)
+        # One settings read serves both the sync and the notification
+        settings = load_settings(readonly=True)
+        result = await sync_manager.sync_all_playlists(context, settings=settings)
 
         # Send notification to user if enabled
-        settings = load_settings()
         user_id = settings.get('user_id')
         notify_enabled = settings.get('notify_sync_results', True)
 
@@ -5629,9 +6334,9 @@ async def auto_sync_job(context: ContextTypes.DEFAULT_TYPE):
 
     except Exception as e:
         sync_logger.error(f"Error in scheduled sync: {e}")
-
-    # Schedule next sync
-    await schedule_next_sync(context)
+    finally:
+        # Re-register with the offset for next week's date (see schedule_next_sync)
+        await schedule_next_sync(context)
 
 async def send_sync_notification(bot, user_id: int, result: dict):
     """Send sync results notification to user"""
@@ -5674,8 +6379,7 @@ async def send_sync_notification(bot, user_id: int, result: dict):
                 message += f"▪️ Errors: {errors}\n"
 
             # Add timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+            timestamp = datetime.now().strftime(_TS_FMT)
             message += f"\n🕒 Completed at: {timestamp}"
 
             # Add manual sync option if there were errors
@@ -5829,6 +6533,63 @@ async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     reply_markup = InlineKeyboardMarkup(keyboard)
     await update.message.reply_text(message, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
 
+# --- CALLBACK ROUTING ---
+def _split_index(arg: str):
+    """Split '{playlist_id}_{n}' callback arguments; playlist IDs may contain '_' themselves
+
+    The index is always the last field, so one rpartition is enough. The '_' format is
+    kept (rather than a new separator) so buttons in already-sent messages keep working.
+    """
+    playlist_id, _, index = arg.rpartition('_')
+    return playlist_id, int(index)
+
+# callback_data values handled by a plain (update, context) handler
+CALLBACK_HANDLERS = {
+    'add_to_existing_playlist_prompt': show_playlists_for_adding_songs,
+    'show_settings': show_settings,
+    'toggle_sync': toggle_sync,
+    'toggle_notifications': toggle_notifications,
+    'configure_priority': configure_priority,
+    'priority_reset': lambda update, context: handle_priority_change(update, context, 'reset', ''),
+    'change_sync_day': change_sync_day,
+    'change_sync_time': change_sync_time,
+    'manual_sync': manual_sync,
+    'confirm_download': perform_download,
+    'confirm_youtube_playlist_download': perform_youtube_playlist_download,
+    'check_all_integrity': check_all_playlists_integrity,
+    'select_playlist_for_track': show_playlists_for_track,
+    'youtube_auto_filename': perform_youtube_download,
+    'youtube_new_folder': youtube_download_to_new_folder,
+    'youtube_select_playlist': youtube_select_playlist,
+    'youtube_create_playlist': youtube_create_playlist,
+    'auto_select_youtube': auto_select_youtube_video,
+}
+
+# "{prefix}{argument}" callbacks, keyed on the text before the first '_' so a
+# click costs one dict lookup: key -> (full prefix, handler(update, context, argument))
+CALLBACK_PREFIX_HANDLERS = {
+    'ast': ('ast_', add_songs_to_playlist),
+    'list': ('list_playlists_', lambda update, context, arg: list_playlists(update, context, page=int(arg))),
+    'pu': ('pu_', lambda update, context, arg: handle_priority_change(update, context, 'up', arg)),
+    'pd': ('pd_', lambda update, context, arg: handle_priority_change(update, context, 'down', arg)),
+    'sd': ('sd_', set_sync_day),
+    'rs': ('rs_', resync_individual_playlist),
+    'upd': ('upd_', perform_update),
+    'dn': ('dn_', download_new_songs),
+    'delete': ('delete_song_', lambda update, context, arg: delete_song(update, context, *_split_index(arg))),
+    'del': ('del_', perform_delete),
+    'ci': ('ci_', perform_integrity_check),
+    'fi': ('fi_', fix_integrity_issues),
+    'ls': ('ls_', list_playlist_songs),
+    'sp': ('sp_', lambda update, context, arg: list_playlist_songs(update, context, *_split_index(arg))),
+    'cdp': ('cdp_', confirm_delete_playlist),
+    'cds': ('cds_', lambda update, context, arg: confirm_delete_song(update, context, *_split_index(arg))),
+    'ss': ('ss_', lambda update, context, arg: show_song_details(update, context, *_split_index(arg))),
+    'att': ('att_', add_track_to_playlist),
+    'yat': ('yat_', youtube_add_to_playlist),
+    'syv': ('syv_', lambda update, context, arg: select_youtube_video(update, context, int(arg))),
+}
+
 def main():
     global sync_manager
 
@@ -5856,10 +6617,25 @@ def main():
     # Setup menu button after application starts
     async def post_init(application):
         await setup_menu_button(application)
+        # Jobs only live in the in-memory job queue, so register the weekly sync on every
+        # start instead of waiting for someone to open the settings screen
+        await schedule_next_sync(ContextTypes.DEFAULT_TYPE(application))
         logger.info("Bot initialization completed")
 
     application.post_init = post_init
 
+    # Release the shared browser and HTTP sessions when the bot stops
+    async def post_shutdown(application):
+        await api_client.aclose()
+        await proxy_manager.aclose()
+        if TUBETIFY_AVAILABLE:
+            await close_tubetify_converter()
+        if CUSTOM_CONVERTER_AVAILABLE:
+            await close_custom_converter()
+        logger.info("Bot shutdown completed")
+
+    application.post_shutdown = post_shutdown
+
     logger.info("Bot has started and is listening...")
     application.run_polling()
 
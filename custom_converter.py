@@ -60,8 +60,24 @@ class CustomConverter:
         self.spotify_pattern = re.compile(r'(?:https://)?open\.spotify\.com/(track|artist|album)/.+')
         self.spotipy_client = None
         self.ytmusic_client = None
+        self._http: Optional[aiohttp.ClientSession] = None
         self._init_clients()
 
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Shared HTTP session for the scraping fallback, so page fetches reuse connections"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60),
+                cookie_jar=aiohttp.DummyCookieJar()  # Keep page fetches independent
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
     def _init_clients(self):
         """Initialize Spotify and YouTube Music clients if dependencies are available"""
         try:
@@ -185,14 +201,14 @@ class CustomConverter:
                 'Upgrade-Insecure-Requests': '1'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(clean_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        html_content = await response.text()
-                        return self._parse_spotify_page(html_content, clean_url)
-                    else:
-                        logger.error(f"Failed to fetch Spotify page: {response.status}")
-                        return None
+            session = await self._get_http()
+            async with session.get(clean_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    html_content = await response.text()
+                    return self._parse_spotify_page(html_content, clean_url)
+                else:
+                    logger.error(f"Failed to fetch Spotify page: {response.status}")
+                    return None
 
         except Exception as e:
             logger.error(f"Web scraping error: {e}")
@@ -411,7 +427,21 @@ class CustomConverter:
             logger.warning("No YouTube matches found")
             return None
 
-# Convenience functions for integration
+# Convenience functions for integration. They share one converter, so the Spotify and
+# YouTube Music clients are set up once and the scraping fallback keeps its connections
+_converter: Optional[CustomConverter] = None
+
+def _get_converter() -> CustomConverter:
+    global _converter
+    if _converter is None:
+        _converter = CustomConverter()
+    return _converter
+
+async def close_custom_converter():
+    """Close the shared converter's HTTP session (call on shutdown)"""
+    if _converter is not None:
+        await _converter.aclose()
+
 async def spotify_to_youtube_custom(spotify_url: str) -> List[Dict[str, Any]]:
     """
     Convert Spotify URL to YouTube videos using custom converter
@@ -422,8 +452,7 @@ async def spotify_to_youtube_custom(spotify_url: str) -> List[Dict[str, Any]]:
     Returns:
         List of YouTube video options
     """
-    converter = CustomConverter()
-    return await converter.convert_spotify_to_youtube(spotify_url)
+    return await _get_converter().convert_spotify_to_youtube(spotify_url)
 
 async def get_youtube_for_spotify_custom(spotify_url: str) -> Optional[str]:
     """
@@ -435,8 +464,7 @@ async def get_youtube_for_spotify_custom(spotify_url: str) -> Optional[str]:
     Returns:
         YouTube URL or None
     """
-    converter = CustomConverter()
-    return await converter.get_best_match(spotify_url)
+    return await _get_converter().get_best_match(spotify_url)
 
 def check_dependencies() -> Dict[str, bool]:
     """
@@ -7,6 +7,7 @@ import subprocess
 import asyncio
 import os
 import sys
+import re
 import json
 import time
 import logging
@@ -17,6 +18,10 @@ from typing import Optional, Dict, Any
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('spotdl_fallback')
 
+# Compilado una vez en lugar de en cada llamada
+_TRACK_ID_RE = re.compile(r'track/([a-zA-Z0-9]+)')
+_YOUTUBE_DOMAINS = ('youtube.com', 'youtu.be')
+
 class SpotDLFallback:
     """
     Fallback robusto usando SpotDL para cuando la API principal falla
@@ -489,8 +494,7 @@ class SpotDLFallback:
     def _extract_track_id(self, spotify_url: str) -> Optional[str]:
         """Extrae el track ID de una URL de Spotify"""
         try:
-            import re
-            match = re.search(r'track/([a-zA-Z0-9]+)', spotify_url)
+            match = _TRACK_ID_RE.search(spotify_url)
             return match.group(1) if match else None
         except:
             return None
@@ -549,10 +553,9 @@ def is_youtube_url(url: str) -> bool:
     Returns:
         True si es una URL de YouTube, False en caso contrario
     """
-    youtube_domains = [
-        'youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com'
-    ]
-    return any(domain in url.lower() for domain in youtube_domains)
+    # 'youtube.com' ya cubre www. y m.; la URL se pasa a minúsculas una sola vez
+    url_lower = url.lower()
+    return any(domain in url_lower for domain in _YOUTUBE_DOMAINS)
 
 # Test independiente
 async def test_spotdl_fallback():
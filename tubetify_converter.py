@@ -17,6 +17,9 @@ from bs4 import BeautifulSoup
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('tubetify_converter')
 
+# YouTube links in result rows look like <a href="https://youtu.be/VIDEO_ID/">
+_YOUTU_BE_RE = re.compile(r'https://youtu\.be/([^/]+)/')
+
 class TubetifyConverter:
     """
     Converts Spotify track URLs to YouTube URLs using tubetify.com
@@ -39,6 +42,23 @@ class TubetifyConverter:
             'Sec-Fetch-User': '?1',
             'Priority': 'u=0, i'
         }
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, so every conversion reuses pooled keep-alive connections"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60),
+                # Each conversion sends its own PHPSESSID, so don't let the jar carry one over
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
 
     def sanitize_spotify_url(self, spotify_url: str) -> str:
         """
@@ -60,25 +80,25 @@ class TubetifyConverter:
     async def get_session(self) -> Optional[str]:
         """Get session ID from tubetify.com"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/convert",
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        # Extract PHPSESSID from cookies
-                        cookies = response.cookies
-                        if 'PHPSESSID' in cookies:
-                            session_id = cookies['PHPSESSID'].value
-                            logger.debug(f"Session ID obtained: {session_id}")
-                            return session_id
-                        else:
-                            logger.warning("No PHPSESSID found in response cookies")
-                            return None
+            session = await self._get_http()
+            async with session.get(
+                f"{self.base_url}/convert",
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    # Extract PHPSESSID from cookies
+                    cookies = response.cookies
+                    if 'PHPSESSID' in cookies:
+                        session_id = cookies['PHPSESSID'].value
+                        logger.debug(f"Session ID obtained: {session_id}")
+                        return session_id
                     else:
-                        logger.error(f"Failed to get session, status: {response.status}")
+                        logger.warning("No PHPSESSID found in response cookies")
                         return None
+                else:
+                    logger.error(f"Failed to get session, status: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error getting session: {e}")
             return None
@@ -120,28 +140,28 @@ class TubetifyConverter:
                 'Cookie': f'PHPSESSID={session_id}'
             })
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/generate",
-                    headers=post_headers,
-                    data=form_data,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        html_content = await response.text()
-                        youtube_videos = self.parse_youtube_results(html_content)
-
-                        if youtube_videos:
-                            logger.info(f"✅ Found {len(youtube_videos)} YouTube video(s)")
-                            return youtube_videos
-                        else:
-                            logger.warning("No YouTube videos found in response")
-                            return []
+            session = await self._get_http()
+            async with session.post(
+                f"{self.base_url}/generate",
+                headers=post_headers,
+                data=form_data,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    html_content = await response.text()
+                    youtube_videos = self.parse_youtube_results(html_content)
+
+                    if youtube_videos:
+                        logger.info(f"✅ Found {len(youtube_videos)} YouTube video(s)")
+                        return youtube_videos
                     else:
-                        logger.error(f"Conversion request failed with status: {response.status}")
-                        response_text = await response.text()
-                        logger.debug(f"Response content: {response_text[:500]}...")
+                        logger.warning("No YouTube videos found in response")
                         return []
+                else:
+                    logger.error(f"Conversion request failed with status: {response.status}")
+                    response_text = await response.text()
+                    logger.debug(f"Response content: {response_text[:500]}...")
+                    return []
 
         except Exception as e:
             logger.error(f"Error converting Spotify to YouTube: {e}")
@@ -165,8 +185,7 @@ class TubetifyConverter:
             table_rows = soup.find_all('tr')
 
             for row in table_rows:
-                # Look for YouTube links in the format <a href="https://youtu.be/VIDEO_ID/">
-                youtube_link = row.find('a', href=re.compile(r'https://youtu\.be/([^/]+)/'))
+                youtube_link = row.find('a', href=_YOUTU_BE_RE)
 
                 if youtube_link:
                     href = youtube_link.get('href')
@@ -253,7 +272,21 @@ class TubetifyConverter:
             logger.warning("No YouTube matches found")
             return None
 
-# Convenience functions for integration
+# Convenience functions for integration. They share one converter (and so one HTTP
+# session) instead of building a new one per track
+_converter: Optional[TubetifyConverter] = None
+
+def _get_converter() -> TubetifyConverter:
+    global _converter
+    if _converter is None:
+        _converter = TubetifyConverter()
+    return _converter
+
+async def close_tubetify_converter():
+    """Close the shared converter's HTTP session (call on shutdown)"""
+    if _converter is not None:
+        await _converter.aclose()
+
 async def spotify_to_youtube(spotify_url: str) -> List[Dict[str, Any]]:
     """
     Convert Spotify URL to YouTube videos
@@ -264,8 +297,7 @@ async def spotify_to_youtube(spotify_url: str) -> List[Dict[str, Any]]:
     Returns:
         List of YouTube video options
     """
-    converter = TubetifyConverter()
-    return await converter.convert_spotify_to_youtube(spotify_url)
+    return await _get_converter().convert_spotify_to_youtube(spotify_url)
 
 async def get_youtube_for_spotify(spotify_url: str) -> Optional[str]:
     """
@@ -277,8 +309,7 @@ async def get_youtube_for_spotify(spotify_url: str) -> Optional[str]:
     Returns:
         YouTube URL or None
     """
-    converter = TubetifyConverter()
-    return await converter.get_best_match(spotify_url)
+    return await _get_converter().get_best_match(spotify_url)
 
 # Test function
 async def test_tubetify_converter():
@@ -290,29 +321,32 @@ async def test_tubetify_converter():
 
     converter = TubetifyConverter()
 
-    # Test sanitization
-    clean_url = converter.sanitize_spotify_url(test_url)
-    print(f"Sanitized URL: {clean_url}")
-
-    # Test conversion
-    videos = await converter.convert_spotify_to_youtube(test_url)
-
-    if videos:
-        print(f"✅ Found {len(videos)} video(s):")
-        for i, video in enumerate(videos, 1):
-            print(f"   {i}. {video['youtube_id']} - {video['video_found']}")
-            print(f"      URL: {video['youtube_url']}")
-            print(f"      Spotify: {video['spotify_track']}")
-            print()
-
-        # Test best match
-        best_match = await converter.get_best_match(test_url)
-        print(f"🎯 Best match: {best_match}")
-
-        return True
-    else:
-        print("❌ No videos found")
-        return False
+    try:
+        # Test sanitization
+        clean_url = converter.sanitize_spotify_url(test_url)
+        print(f"Sanitized URL: {clean_url}")
+
+        # Test conversion
+        videos = await converter.convert_spotify_to_youtube(test_url)
+
+        if videos:
+            print(f"✅ Found {len(videos)} video(s):")
+            for i, video in enumerate(videos, 1):
+                print(f"   {i}. {video['youtube_id']} - {video['video_found']}")
+                print(f"      URL: {video['youtube_url']}")
+                print(f"      Spotify: {video['spotify_track']}")
+                print()
+
+            # Test best match
+            best_match = await converter.get_best_match(test_url)
+            print(f"🎯 Best match: {best_match}")
+
+            return True
+        else:
+            print("❌ No videos found")
+            return False
+    finally:
+        await converter.aclose()
 
 if __name__ == "__main__":
     # Test the converter